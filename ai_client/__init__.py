@@ -36,6 +36,7 @@ from .alibaba_client import AlibabaClient
 from .cohere_client import CohereClient
 from .xai_client import XAIClient
 from .response import LLMResponse, Usage
+from .response_cache import InMemoryResponseCache
 from .pricing import set_pricing_file
 from .utils import (
     retry_with_exponential_backoff,
@@ -70,6 +71,7 @@ __all__ = [
     # Response and utility classes
     "LLMResponse",
     "Usage",
+    "InMemoryResponseCache",
     # Pricing
     "set_pricing_file",
     # Utility functions and exceptions
@@ -8,11 +8,20 @@ implementations to subclasses.
 """
 
 import abc
+import copy
+import functools
+import hashlib
+import json
+import os
 import time
 import asyncio
+import threading
+from collections import OrderedDict
 from typing import List, Tuple, Any, Optional, Union
 from .response import LLMResponse, Usage
 from .utils import (
+    async_retry_with_exponential_backoff,
+    json_schema_for,
     retry_with_exponential_backoff,
     read_text_files,
     resize_image_if_needed,
@@ -37,6 +46,7 @@ class BaseAIClient(abc.ABC):
     Attributes:
         PROVIDER_ID (str): The unique identifier for this AI provider
         SUPPORTS_MULTIMODAL (bool): Whether this provider supports multimodal content
+        SUPPORTS_NATIVE_ASYNC (bool): Whether prompt_async uses the provider's async SDK
         api_key (str): The API key used for authentication
         system_prompt (str): Default system prompt for requests
         settings (dict): Provider-specific settings like temperature, max_tokens, etc.
@@ -48,6 +58,18 @@ class BaseAIClient(abc.ABC):
     PROVIDER_ID = "base"
     SUPPORTS_MULTIMODAL = False
     SUPPORTS_TOOLS = False
+    SUPPORTS_NATIVE_ASYNC = False
+
+    # Exceptions from _do_prompt that trigger a retry; providers narrow this to
+    # transient errors (see also _is_retryable_error)
+    RETRYABLE_EXCEPTIONS: tuple = (Exception,)
+
+    # Maximum number of resized image paths remembered per client
+    RESIZE_CACHE_SIZE = 256
+
+    # Requests with a higher (or no explicit) temperature bypass the response cache
+    # (see response_cache)
+    RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
 
     def __init__(
         self,
@@ -58,6 +80,7 @@ class BaseAIClient(abc.ABC):
         image_quality: int = 85,
         tool_config: Optional[dict] = None,
         content_order: Optional[Union[str, List[str], ContentOrder]] = None,
+        response_cache: Optional[Any] = None,
         **settings,
     ):
         """
@@ -78,6 +101,11 @@ class BaseAIClient(abc.ABC):
                 Examples:
                     content_order='attachments_before_prompt'
                     content_order=['images', 'prompt', 'files']
+            response_cache: Optional cache object with ``get(key)`` and ``set(key, response)``
+                methods (e.g. InMemoryResponseCache). Identical requests are then answered
+                from the cache. Requests using tools, a temperature above
+                RESPONSE_CACHE_MAX_TEMPERATURE, or no temperature at all (providers then
+                sample at their default, usually 1.0) are never cached.
             **settings: Additional provider-specific settings like temperature, max_tokens, etc.
         """
         self.init_time = time.time()
@@ -90,6 +118,7 @@ class BaseAIClient(abc.ABC):
         self.max_image_size = max_image_size
         self.image_quality = image_quality
         self.content_order = content_order
+        self.response_cache = response_cache
         self.settings = settings
         self.api_client = None
 
@@ -102,9 +131,32 @@ class BaseAIClient(abc.ABC):
         # Tool registry (lazy-loaded on first tool use)
         self.tool_registry = None
 
+        # Resized image cache: (path, mtime_ns, size, max_size, quality) -> resized path
+        self._resize_cache: OrderedDict = OrderedDict()
+        self._resize_cache_lock = threading.Lock()
+
+        # Optional limit on concurrent prompt_async() calls (see _get_async_semaphore)
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_semaphore_loop = None
+
         # Initialize the client implementation
         self._init_client()
 
+        # Retry-wrapped prompt callables, built once per client
+        retry_options = {
+            "max_retries": 3,
+            "initial_delay": 1.0,
+            "max_delay": 60.0,
+            "retryable_exceptions": self.RETRYABLE_EXCEPTIONS,
+            "retry_if": self._is_retryable_error,
+        }
+        self._do_prompt_retry = retry_with_exponential_backoff(
+            self._call_do_prompt, **retry_options
+        )
+        self._do_prompt_async_retry = async_retry_with_exponential_backoff(
+            self._call_do_prompt_async, **retry_options
+        )
+
     @abc.abstractmethod
     def _init_client(self):
         """
@@ -136,6 +188,23 @@ class BaseAIClient(abc.ABC):
         self.api_client = None
         self.end_time = time.time()
 
+    async def aend_client(self):
+        """
+        End the client session from async code, closing the async SDK client.
+
+        Await this on the event loop that ran prompt_async() so the async
+        client's connection pool is closed instead of being dropped.
+        """
+        await self._close_async_client()
+        self.end_client()
+
+    async def _close_async_client(self):
+        """
+        Close the provider's async SDK client, if one was opened on the running loop.
+
+        Providers with SUPPORTS_NATIVE_ASYNC override this; the default does nothing.
+        """
+
     @staticmethod
     def is_url(resource: str) -> bool:
         """
@@ -147,7 +216,7 @@ class BaseAIClient(abc.ABC):
         Returns:
             True if the resource is a URL, False if it's a file path
         """
-        return resource.startswith(("http://", "https://"))
+        return resource.startswith("https://") or resource.startswith("http://")
 
     def _resolve_content_order(
         self, order: Optional[Union[str, List[str], ContentOrder]] = None
@@ -279,6 +348,87 @@ class BaseAIClient(abc.ABC):
         """
         start_time = time.time()
 
+        call_kwargs, messages, existing_cache_ref = self._prepare_prompt(
+            model=model,
+            prompt=prompt,
+            images=images,
+            files=files,
+            system_prompt=system_prompt,
+            response_format=response_format,
+            conversation_id=conversation_id,
+            cache=cache,
+            tool=tool,
+            content_order=content_order,
+            kwargs=kwargs,
+        )
+
+        # Call provider-specific implementation with retry logic
+        try:
+            cache_key = self._response_cache_key(call_kwargs)
+            response = self._get_cached_response(cache_key)
+            if response is None:
+                response = self._do_prompt_with_retry(**call_kwargs)
+                self._set_cached_response(cache_key, response)
+
+            # Handle tool execution if tools were called
+            if tool and response.tool_calls:
+                # Execute all tool calls
+                tool_results = self._execute_tools(
+                    response.tool_calls, call_kwargs.get("_tool_definitions", [])
+                )
+
+                # Make second call with tool results
+                # NOW we can use response_format to structure the final answer
+                final_response = self._do_prompt_with_retry(
+                    **self._tool_followup_kwargs(
+                        call_kwargs, response_format, response.tool_calls, tool_results
+                    )
+                )
+
+                # Attach tool execution metadata
+                final_response.tool_calls = response.tool_calls
+                final_response.tool_results = tool_results
+
+                # Use final response for conversation tracking
+                response = final_response
+
+            self._store_conversation(response, conversation_id, messages, existing_cache_ref)
+
+        except Exception as e:
+            # Create error response
+            response = self._create_error_response(model, str(e))
+
+        elapsed_time = time.time() - start_time
+        response.duration = elapsed_time
+
+        return response
+
+    def _prepare_prompt(
+        self,
+        model: str,
+        prompt: str,
+        images: Optional[List[str]],
+        files: Optional[List[str]],
+        system_prompt: Optional[str],
+        response_format: Optional[Any],
+        conversation_id: Optional[str],
+        cache: bool,
+        tool: Optional[Union[str, List[str]]],
+        content_order: Optional[Union[str, List[str], ContentOrder]],
+        kwargs: dict,
+    ) -> Tuple[dict, List[dict], Optional[Any]]:
+        """
+        Resolve files, images, conversation history and tools for a prompt.
+
+        Shared by prompt() and the native async path of prompt_async().
+
+        Returns:
+            Tuple of (keyword arguments for _do_prompt, conversation messages
+            including the new user prompt, cache_ref of the existing conversation)
+
+        Raises:
+            ToolNotSupportedError: If tools are requested from a provider without tool support
+        """
         # Use provided system prompt or fall back to default
         sys_prompt = system_prompt or self.system_prompt
 
@@ -316,10 +466,7 @@ class BaseAIClient(abc.ABC):
 
         # Resize images if needed
         if image_list and self.max_image_size:
-            image_list = [
-                resize_image_if_needed(img, self.max_image_size, self.image_quality)
-                for img in image_list
-            ]
+            image_list = [self._resize_image(img) for img in image_list]
 
         # Handle tool calling if requested
         if tool:
@@ -347,76 +494,195 @@ class BaseAIClient(abc.ABC):
             # Pass to provider via kwargs (internal parameter)
             kwargs["_tool_definitions"] = tool_definitions
 
-        # Call provider-specific implementation with retry logic
-        try:
-            # If using tools, don't use response_format in the first call
-            # (first call is just to get tool calls, second call will format the response)
-            first_call_response_format = None if tool else response_format
+        # If using tools, don't use response_format in the first call
+        # (first call is just to get tool calls, second call will format the response)
+        first_call_response_format = None if tool else response_format
+
+        call_kwargs = {
+            "model": model,
+            "prompt": prompt,
+            "messages": messages if len(messages) > 1 else None,
+            "images": image_list,
+            "system_prompt": sys_prompt,
+            "response_format": first_call_response_format,
+            "cache": cache,
+            "file_content": file_content,
+            **kwargs,
+        }
+        return call_kwargs, messages, existing_cache_ref
+
+    def _tool_followup_kwargs(
+        self,
+        call_kwargs: dict,
+        response_format: Optional[Any],
+        tool_calls: List[dict[str, Any]],
+        tool_results: List[dict[str, Any]],
+    ) -> dict:
+        """
+        Build _do_prompt arguments for the second call that returns tool results.
 
-            response = self._do_prompt_with_retry(
-                model=model,
-                prompt=prompt,
-                messages=messages if len(messages) > 1 else None,
-                images=image_list,
-                system_prompt=sys_prompt,
-                response_format=first_call_response_format,
-                cache=cache,
-                file_content=file_content,
-                **kwargs,
-            )
+        Internal (underscore-prefixed) parameters are dropped and the structured
+        output format is applied to the final answer.
+        """
+        followup = {k: v for k, v in call_kwargs.items() if not k.startswith("_")}
+        followup["messages"] = self._build_tool_messages(
+            call_kwargs["prompt"], tool_calls, tool_results
+        )
+        followup["response_format"] = response_format
+        followup["file_content"] = ""
+        return followup
 
-            # Handle tool execution if tools were called
-            if tool and response.tool_calls:
-                # Execute all tool calls
-                tool_results = self._execute_tools(
-                    response.tool_calls, kwargs.get("_tool_definitions", [])
-                )
+    def _response_cache_key(self, call_kwargs: dict) -> Optional[dict]:
+        """
+        Describe a request for the response cache.
 
-                # Make second call with tool results
-                # NOW we can use response_format to structure the final answer
-                final_response = self._do_prompt_with_retry(
-                    model=model,
-                    prompt=prompt,
-                    messages=self._build_tool_messages(prompt, response.tool_calls, tool_results),
-                    images=image_list,
-                    system_prompt=sys_prompt,
-                    response_format=response_format,  # Apply structured output to final answer
-                    cache=cache,
-                    file_content="",
-                    **{k: v for k, v in kwargs.items() if not k.startswith("_")},
-                )
+        Returns:
+            The cache key (request description plus its SHA-256 ``hash``), or None
+            if there is no response cache or the request must not be cached
+        """
+        if self.response_cache is None or call_kwargs.get("_tool_definitions"):
+            return None
+
+        # Without an explicit temperature the provider samples at its default (usually 1.0)
+        temperature = call_kwargs.get("temperature", self.settings.get("temperature"))
+        if temperature is None or temperature > self.RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+
+        images = []
+        for image in call_kwargs.get("images") or []:
+            if self.is_url(image):
+                images.append(image)
+                continue
+            try:
+                # Identify local files by version so edited images miss the cache
+                stat = os.stat(image)
+                images.append([os.path.abspath(image), stat.st_mtime_ns, stat.st_size])
+            except (OSError, ValueError):
+                images.append(image)
+
+        response_format = call_kwargs.get("response_format")
+        schema = None
+        if isinstance(response_format, type):
+            schema = json_schema_for(response_format)
+        elif response_format is not None and hasattr(response_format, "model_json_schema"):
+            schema = response_format.model_json_schema()
+
+        handled = {"model", "prompt", "messages", "images", "system_prompt", "response_format"}
+        params = {
+            k: v
+            for k, v in call_kwargs.items()
+            if k not in handled and k != "cache" and not k.startswith("_")
+        }
+        if "_content_order" in call_kwargs:
+            params["content_order"] = call_kwargs["_content_order"]
+
+        key = {
+            "provider": self.PROVIDER_ID,
+            "base_url": self.base_url,
+            "model": call_kwargs["model"],
+            "system_prompt": call_kwargs.get("system_prompt"),
+            "prompt": call_kwargs["prompt"],
+            "messages": call_kwargs.get("messages"),
+            "images": images,
+            "response_format": getattr(response_format, "__qualname__", response_format),
+            "schema": schema,
+            "params": params,
+            "settings": self.settings,
+        }
+        serialized = json.dumps(key, sort_keys=True, default=str)
+        key["hash"] = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return key
+
+    def _get_cached_response(self, cache_key: Optional[dict]) -> Optional[LLMResponse]:
+        """Return a (deep) copy of the cached response for a key, or None on a miss."""
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        response = copy.deepcopy(cached)
+        response.duration = 0.0
+        return response
 
-                # Attach tool execution metadata
-                final_response.tool_calls = response.tool_calls
-                final_response.tool_results = tool_results
+    def _set_cached_response(self, cache_key: Optional[dict], response: LLMResponse) -> None:
+        """
+        Store a copy of a response, so later changes to it do not affect the cache.
 
-                # Use final response for conversation tracking
-                response = final_response
+        Responses are deep-copied on the way in and out: usage, parsed output and
+        tool calls are mutable and must not be shared between callers.
+        """
+        if cache_key is not None:
+            self.response_cache.set(cache_key, copy.deepcopy(response))
 
-            # Create or update conversation ID
-            if conversation_id is None and len(messages) > 0:
-                # Create new conversation ID
-                import uuid
+    def _store_conversation(
+        self,
+        response: LLMResponse,
+        conversation_id: Optional[str],
+        messages: List[dict],
+        existing_cache_ref: Optional[Any],
+    ) -> None:
+        """Record the assistant reply in the conversation history and tag the response."""
+        # Create or update conversation ID
+        if conversation_id is None and len(messages) > 0:
+            # Create new conversation ID
+            import uuid
+
+            conversation_id = str(uuid.uuid4())
+
+        if conversation_id:
+            # Store conversation history
+            messages.append({"role": "assistant", "content": response.text})
+            self.conversations[conversation_id] = {
+                "messages": messages,
+                "cache_ref": getattr(response, "cache_ref", existing_cache_ref),
+            }
+            response.conversation_id = conversation_id
+
+    def _resize_image(self, image_path: str) -> str:
+        """
+        Resize a local image if needed, reusing earlier results for unchanged files.
 
-                conversation_id = str(uuid.uuid4())
+        Results are cached per client, keyed on the file's path, modification time
+        and size plus the resize settings, so repeated prompts with the same image
+        skip decoding and re-encoding. URLs are returned unchanged.
 
-            if conversation_id:
-                # Store conversation history
-                messages.append({"role": "assistant", "content": response.text})
-                self.conversations[conversation_id] = {
-                    "messages": messages,
-                    "cache_ref": getattr(response, "cache_ref", existing_cache_ref),
-                }
-                response.conversation_id = conversation_id
+        Args:
+            image_path: Path or URL of the image
 
-        except Exception as e:
-            # Create error response
-            response = self._create_error_response(model, str(e))
+        Returns:
+            Path to the image to use (original or resized temp file)
+        """
+        if self.is_url(image_path):
+            return image_path
 
-        elapsed_time = time.time() - start_time
-        response.duration = elapsed_time
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return resize_image_if_needed(image_path, self.max_image_size, self.image_quality)
+
+        key = (
+            os.path.abspath(image_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.max_image_size,
+            self.image_quality,
+        )
 
-        return response
+        with self._resize_cache_lock:
+            cached = self._resize_cache.get(key)
+            if cached is not None and os.path.exists(cached):
+                self._resize_cache.move_to_end(key)
+                return cached
+
+        resized = resize_image_if_needed(image_path, self.max_image_size, self.image_quality)
+
+        with self._resize_cache_lock:
+            self._resize_cache[key] = resized
+            self._resize_cache.move_to_end(key)
+            while len(self._resize_cache) > self.RESIZE_CACHE_SIZE:
+                self._resize_cache.popitem(last=False)
+
+        return resized
 
     def _do_prompt_with_retry(self, **kwargs) -> LLMResponse:
         """
@@ -424,16 +690,38 @@ class BaseAIClient(abc.ABC):
 
         This wraps the provider-specific _do_prompt method with retry logic.
         """
-        # Configure retry for common rate limit errors
-        retry_func = retry_with_exponential_backoff(
-            self._do_prompt,
-            max_retries=3,
-            initial_delay=1.0,
-            max_delay=60.0,
-            retryable_exceptions=(Exception,),  # Provider-specific exceptions will be caught
-        )
+        return self._do_prompt_retry(**kwargs)
 
-        return retry_func(**kwargs)
+    async def _do_prompt_async_with_retry(self, **kwargs) -> LLMResponse:
+        """
+        Execute the async prompt with retry logic for rate limiting.
+
+        This wraps the provider-specific _do_prompt_async method with retry logic.
+        """
+        return await self._do_prompt_async_retry(**kwargs)
+
+    def _call_do_prompt(self, **kwargs) -> LLMResponse:
+        """Call _do_prompt, looked up per call so instance-level overrides apply."""
+        return self._do_prompt(**kwargs)
+
+    async def _call_do_prompt_async(self, **kwargs) -> LLMResponse:
+        """Call _do_prompt_async, looked up per call so instance-level overrides apply."""
+        return await self._do_prompt_async(**kwargs)
+
+    def _is_retryable_error(self, exception: Exception) -> bool:
+        """
+        Decide whether a caught RETRYABLE_EXCEPTIONS error is worth retrying.
+
+        Providers override this to skip errors that will not succeed on retry
+        (authentication, invalid requests, unknown models).
+
+        Args:
+            exception: The exception raised by _do_prompt
+
+        Returns:
+            True if the request should be retried
+        """
+        return True
 
     @abc.abstractmethod
     def _do_prompt(
@@ -469,6 +757,23 @@ class BaseAIClient(abc.ABC):
         """
         pass
 
+    async def _do_prompt_async(self, **kwargs) -> LLMResponse:
+        """
+        Async provider-specific prompt implementation.
+
+        Providers with a native async SDK override this and set
+        SUPPORTS_NATIVE_ASYNC = True. The default runs _do_prompt in the
+        default executor.
+
+        Args:
+            **kwargs: Same arguments as _do_prompt
+
+        Returns:
+            LLMResponse object with the provider's response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self._do_prompt, **kwargs))
+
     async def prompt_async(
         self,
         model: str,
@@ -480,11 +785,19 @@ class BaseAIClient(abc.ABC):
         conversation_id: Optional[str] = None,
         cache: bool = False,
         content_order: Optional[Union[str, List[str], ContentOrder]] = None,
+        tool: Optional[Union[str, List[str]]] = None,
         **kwargs,
     ) -> LLMResponse:
         """
         Async version of prompt() for parallel processing.
 
+        Providers with SUPPORTS_NATIVE_ASYNC use their async SDK client, so many
+        requests can be in flight without occupying a thread each. Other providers
+        run prompt() in the default executor.
+
+        Set ``max_concurrent_requests`` in the client settings to cap the number
+        of concurrent prompt_async() calls per client.
+
         Args:
             model: The model identifier to use
             prompt: The text prompt to send
@@ -494,16 +807,133 @@ class BaseAIClient(abc.ABC):
             response_format: Optional Pydantic model for structured output
             conversation_id: Continue an existing conversation by ID
             cache: Enable caching (provider-specific)
+            content_order: Override the client-level content_order for this request only
+            tool: Optional tool name(s) from registry
             **kwargs: Additional provider-specific parameters
 
         Returns:
             LLMResponse object with response and usage information
         """
-        # Default implementation runs sync version in executor
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
+        semaphore = self._get_async_semaphore()
+        if semaphore is None:
+            return await self._run_prompt_async(
+                model,
+                prompt,
+                images,
+                files,
+                system_prompt,
+                response_format,
+                conversation_id,
+                cache,
+                content_order,
+                tool,
+                kwargs,
+            )
+
+        async with semaphore:
+            return await self._run_prompt_async(
+                model,
+                prompt,
+                images,
+                files,
+                system_prompt,
+                response_format,
+                conversation_id,
+                cache,
+                content_order,
+                tool,
+                kwargs,
+            )
+
+    def prompt_many(
+        self,
+        model: str,
+        prompts: List[str],
+        concurrency: int = 16,
+        **kwargs,
+    ) -> List[LLMResponse]:
+        """
+        Send several prompts concurrently and return their responses in order.
+
+        Runs prompt_async() for every prompt on a new event loop with at most
+        ``concurrency`` requests in flight, so a batch costs roughly the latency
+        of its slowest requests instead of the sum of all of them. The async SDK
+        client opened for the batch is closed before the loop ends. Must not be
+        called from a running event loop; gather prompt_async() calls there.
+
+        Args:
+            model: The model identifier to use
+            prompts: The text prompts to send
+            concurrency: Maximum number of requests in flight at once
+            **kwargs: Arguments passed to every prompt_async() call
+                (images, system_prompt, response_format, ...)
+
+        Returns:
+            List of LLMResponse objects, one per prompt, in the order of ``prompts``
+
+        Example:
+            >>> responses = client.prompt_many('gpt-4o', ['Hello!', 'Bonjour!'], temperature=0)
+        """
+
+        async def run_all() -> List[LLMResponse]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run_one(prompt: str) -> LLMResponse:
+                async with semaphore:
+                    return await self.prompt_async(model, prompt, **kwargs)
+
+            try:
+                return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
+            finally:
+                # The async client is bound to this loop, which ends with asyncio.run()
+                await self._close_async_client()
+
+        return list(asyncio.run(run_all()))
+
+    async def _run_prompt_async(
+        self,
+        model: str,
+        prompt: str,
+        images: Optional[List[str]],
+        files: Optional[List[str]],
+        system_prompt: Optional[str],
+        response_format: Optional[Any],
+        conversation_id: Optional[str],
+        cache: bool,
+        content_order: Optional[Union[str, List[str], ContentOrder]],
+        tool: Optional[Union[str, List[str]]],
+        kwargs: dict,
+    ) -> LLMResponse:
+        """Run a single prompt_async() request (see prompt_async for arguments)."""
+        loop = asyncio.get_running_loop()
+
+        if not self.SUPPORTS_NATIVE_ASYNC:
+            # Default implementation runs sync version in executor
+            return await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.prompt,
+                    model=model,
+                    prompt=prompt,
+                    images=images,
+                    files=files,
+                    system_prompt=system_prompt,
+                    response_format=response_format,
+                    conversation_id=conversation_id,
+                    cache=cache,
+                    tool=tool,
+                    content_order=content_order,
+                    **kwargs,
+                ),
+            )
+
+        start_time = time.time()
+
+        # File reads and image resizing block, so keep them off the event loop
+        call_kwargs, messages, existing_cache_ref = await loop.run_in_executor(
             None,
-            lambda: self.prompt(
+            functools.partial(
+                self._prepare_prompt,
                 model=model,
                 prompt=prompt,
                 images=images,
@@ -512,11 +942,65 @@ class BaseAIClient(abc.ABC):
                 response_format=response_format,
                 conversation_id=conversation_id,
                 cache=cache,
+                tool=tool,
                 content_order=content_order,
-                **kwargs,
+                kwargs=kwargs,
             ),
         )
 
+        try:
+            cache_key = None
+            if self.response_cache is not None:
+                # Building the key stats image files and hashes the request
+                cache_key = await loop.run_in_executor(None, self._response_cache_key, call_kwargs)
+            response = self._get_cached_response(cache_key)
+            if response is None:
+                response = await self._do_prompt_async_with_retry(**call_kwargs)
+                self._set_cached_response(cache_key, response)
+
+            if tool and response.tool_calls:
+                tool_results = await loop.run_in_executor(
+                    None,
+                    self._execute_tools,
+                    response.tool_calls,
+                    call_kwargs.get("_tool_definitions", []),
+                )
+
+                final_response = await self._do_prompt_async_with_retry(
+                    **self._tool_followup_kwargs(
+                        call_kwargs, response_format, response.tool_calls, tool_results
+                    )
+                )
+
+                final_response.tool_calls = response.tool_calls
+                final_response.tool_results = tool_results
+                response = final_response
+
+            self._store_conversation(response, conversation_id, messages, existing_cache_ref)
+
+        except Exception as e:
+            response = self._create_error_response(model, str(e))
+
+        response.duration = time.time() - start_time
+        return response
+
+    def _get_async_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """
+        Get the semaphore limiting concurrent prompt_async() calls, if configured.
+
+        A semaphore is bound to the event loop it is first used on, so a new one
+        is created whenever the running loop changes.
+        """
+        limit = self.settings.get("max_concurrent_requests")
+        if not limit:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_semaphore is None or self._async_semaphore_loop is not loop:
+            self._async_semaphore = asyncio.Semaphore(limit)
+            self._async_semaphore_loop = loop
+        return self._async_semaphore
+
     def _create_error_response(self, model: str, error_message: str) -> LLMResponse:
         """
         Create an error response when the request fails.
@@ -681,6 +1165,38 @@ class BaseAIClient(abc.ABC):
         return self.PROVIDER_ID
 
 
+@functools.lru_cache(maxsize=1)
+def _get_provider_map() -> dict:
+    """
+    Build the provider ID to client class mapping.
+
+    Built on first use rather than at import time because the client modules
+    import this module.
+    """
+    from .openai_client import OpenAIClient
+    from .gemini_client import GeminiClient
+    from .claude_client import ClaudeClient
+    from .mistral_client import MistralClient
+    from .deepseek_client import DeepSeekClient
+    from .alibaba_client import AlibabaClient
+    from .cohere_client import CohereClient
+    from .xai_client import XAIClient
+
+    return {
+        "openai": OpenAIClient,
+        "genai": GeminiClient,
+        "google": GeminiClient,
+        "anthropic": ClaudeClient,
+        "mistral": MistralClient,
+        "deepseek": DeepSeekClient,
+        "alibaba": AlibabaClient,
+        "cohere": CohereClient,
+        "x-ai": XAIClient,
+        "openrouter": OpenAIClient,  # Uses OpenAI-compatible API
+        "scicore": OpenAIClient,  # Uses OpenAI-compatible API
+    }
+
+
 def create_ai_client(
     provider: str,
     api_key: str,
@@ -690,6 +1206,7 @@ def create_ai_client(
     image_quality: int = 85,
     tool_config: Optional[dict] = None,
     content_order: Optional[Union[str, List[str], "ContentOrder"]] = None,
+    response_cache: Optional[Any] = None,
     **settings,
 ) -> BaseAIClient:
     """
@@ -705,6 +1222,7 @@ def create_ai_client(
         tool_config: Optional dict of tool configurations/credentials
             Example: {"GeonamesAPI": {"api_key": "xyz"}, "WeatherAPI": {"endpoint": "..."}}
             Tools can read from env vars by default, this allows programmatic override
+        response_cache: Optional response cache (see BaseAIClient.__init__)
         **settings: Additional provider-specific settings
 
     Returns:
@@ -737,30 +1255,10 @@ def create_ai_client(
         >>> client = create_ai_client('openai', api_key=os.environ['OPENAI_API_KEY'],
         ...                          tool_config={"WeatherAPI": {"api_key": os.environ['WEATHER_KEY']}})
     """
-    from .openai_client import OpenAIClient
-    from .gemini_client import GeminiClient
-    from .claude_client import ClaudeClient
-    from .mistral_client import MistralClient
-    from .deepseek_client import DeepSeekClient
-    from .alibaba_client import AlibabaClient
-    from .cohere_client import CohereClient
-    from .xai_client import XAIClient
-
-    provider_map = {
-        "openai": OpenAIClient,
-        "genai": GeminiClient,
-        "google": GeminiClient,
-        "anthropic": ClaudeClient,
-        "mistral": MistralClient,
-        "deepseek": DeepSeekClient,
-        "alibaba": AlibabaClient,
-        "cohere": CohereClient,
-        "x-ai": XAIClient,
-        "openrouter": OpenAIClient,  # Uses OpenAI-compatible API
-        "scicore": OpenAIClient,  # Uses OpenAI-compatible API
-    }
+    provider_map = _get_provider_map()
+    client_class = provider_map.get(provider)
 
-    if provider not in provider_map:
+    if client_class is None:
         raise ValueError(
             f"Unsupported AI provider: {provider}. "
             f"Supported providers: {', '.join(provider_map.keys())}"
@@ -772,7 +1270,6 @@ def create_ai_client(
     elif provider == "scicore" and base_url is None:
         base_url = "https://llm-api-h200.ceda.unibas.ch/litellm"
 
-    client_class = provider_map[provider]
     client = client_class(
         api_key,
         system_prompt,
@@ -781,6 +1278,7 @@ def create_ai_client(
         image_quality,
         tool_config,
         content_order,
+        response_cache=response_cache,
         **settings,
     )
 
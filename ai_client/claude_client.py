@@ -6,21 +6,107 @@ interface specifically for Anthropic's Claude API, supporting both text and mult
 interactions.
 """
 
-import base64
-import json
+import asyncio
+import functools
+import importlib.util
 import logging
-from datetime import datetime
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import List, Tuple, Any, Optional
 
-from anthropic import Anthropic
+import anthropic
+import httpx
+import requests
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
+from requests.adapters import HTTPAdapter
 
 from .base_client import BaseAIClient
 from .response import LLMResponse, Usage
 from .pricing import calculate_cost
-from .utils import extract_json_from_text
+from .utils import (
+    b64encode_bytes,
+    b64encode_file,
+    detect_image_mime_type,
+    extract_json_from_text,
+    is_rate_limit_error,
+    json_dumps,
+    json_schema_for,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default max_tokens per model tier; models without a known tier use _DEFAULT_MAX_TOKENS
+_MODEL_MAX_TOKENS = {"opus": 4096, "sonnet": 8192, "haiku": 4096}
+_MODEL_TIER_RE = re.compile(r"(opus|sonnet|haiku)", re.IGNORECASE)
+_DEFAULT_MAX_TOKENS = 4096
+
+# Upper bound on concurrent image loads (URL downloads and local file reads)
+_MAX_IMAGE_WORKERS = 8
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated image downloads reuse connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http_session = _create_http_session()
+
+# HTTP/2 lets concurrent requests share one connection; it needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP2_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0
+)
+
+# Anthropic clients shared across ClaudeClient instances, keyed on (api_key, base_url, http2),
+# so each new ClaudeClient reuses an existing connection pool instead of opening its own
+_client_pool: dict = {}
+_client_pool_lock = threading.Lock()
+
+
+def _format_created_at(created_at: Any) -> Optional[str]:
+    """
+    Format a model's creation date as YYYY-MM-DD.
+
+    Accepts a datetime (what the Anthropic SDK returns), a Unix timestamp or an
+    ISO 8601 string. Returns None for anything else.
+    """
+    if isinstance(created_at, datetime):
+        return created_at.strftime("%Y-%m-%d")
+    if isinstance(created_at, (int, float)):
+        return datetime.fromtimestamp(created_at, tz=timezone.utc).strftime("%Y-%m-%d")
+    if isinstance(created_at, str):
+        try:
+            return datetime.fromisoformat(created_at[:10]).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _structured_output_params(cls: Any) -> Tuple[List[dict], dict]:
+    """
+    Return the structured-output ``(tools, tool_choice)`` pair for a Pydantic model class.
+
+    Both are built once per class and shared between requests, so callers
+    must not mutate them. The cache holds the class itself rather than its
+    ``id()``, so a collected class cannot alias a new one.
+    """
+    tools = [
+        {
+            "name": "extract_structured_data",
+            "description": "Extract structured data according to the provided schema",
+            "input_schema": json_schema_for(cls),
+        }
+    ]
+    tool_choice = {"type": "tool", "name": "extract_structured_data"}
+    return tools, tool_choice
+
 
 class ClaudeClient(BaseAIClient):
     """
@@ -31,7 +117,8 @@ class ClaudeClient(BaseAIClient):
 
     Key features:
     - Integration with Anthropic's Messages API
-    - Support for multimodal content (text + images)
+    - Support for multimodal content (text + images); URL images are sent as
+      ``url`` sources unless ``prefer_url_images=False`` is passed in settings
     - Support for Claude-specific parameters like top_p, top_k
     - Structured output via tools API
     """
@@ -39,10 +126,219 @@ class ClaudeClient(BaseAIClient):
     PROVIDER_ID = "anthropic"
     SUPPORTS_MULTIMODAL = True  # Claude supports images
     SUPPORTS_TOOLS = True  # Claude supports tool calling
+    SUPPORTS_NATIVE_ASYNC = True  # prompt_async uses AsyncAnthropic
+
+    # Connection problems and HTTP errors; status errors are filtered in _is_retryable_error
+    RETRYABLE_EXCEPTIONS = (anthropic.APIConnectionError, anthropic.APIStatusError)
 
     def _init_client(self):
-        """Initialize the Anthropic client with the provided API key."""
-        self.api_client = Anthropic(api_key=self.api_key, timeout=300.0)  # 5 minutes timeout
+        """
+        Initialize the Anthropic client with the provided API key.
+
+        Clients are pooled per (api_key, base_url, HTTP/2), so creating many
+        ClaudeClient instances reuses the same HTTP connection pool. The SDK's own
+        retries are disabled because _do_prompt_with_retry already retries failed
+        requests.
+        """
+        use_http2 = self._use_http2()
+        key = (self.api_key, self.base_url, use_http2)
+        with _client_pool_lock:
+            client = _client_pool.get(key)
+            if client is None:
+                kwargs = self._client_kwargs()
+                if use_http2:
+                    kwargs["http_client"] = DefaultHttpxClient(
+                        http2=True, timeout=300.0, limits=_HTTP2_LIMITS
+                    )
+                client = Anthropic(**kwargs)
+                _client_pool[key] = client
+        self.api_client = client
+        self.async_api_client = None
+        self._async_client_loop = None
+
+    def _use_http2(self) -> bool:
+        """
+        Check whether the Anthropic clients should speak HTTP/2.
+
+        HTTP/2 is used when the h2 package is installed (e.g. via the "fast" extra)
+        unless ``http2=False`` is passed in the client settings.
+        """
+        return _HTTP2_AVAILABLE and self.settings.get("http2", True)
+
+    def _client_kwargs(self) -> dict:
+        """Build the keyword arguments shared by the sync and async Anthropic clients."""
+        kwargs = {"api_key": self.api_key, "timeout": 300.0, "max_retries": 0}  # 5 min timeout
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
+    def _get_async_client(self) -> AsyncAnthropic:
+        """
+        Get the AsyncAnthropic client, creating it on first use.
+
+        The async client is per instance (not pooled) because its connections
+        belong to the event loop they were opened on; a new client is created
+        whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_api_client is None or self._async_client_loop is not loop:
+            kwargs = self._client_kwargs()
+            if self._use_http2():
+                kwargs["http_client"] = DefaultAsyncHttpxClient(
+                    http2=True, timeout=300.0, limits=_HTTP2_LIMITS
+                )
+            self.async_api_client = AsyncAnthropic(**kwargs)
+            self._async_client_loop = loop
+        return self.async_api_client
+
+    async def _close_async_client(self):
+        """
+        Close the AsyncAnthropic client (and its HTTP/2 transport) opened on the running loop.
+
+        A client from another loop is only dropped: its connections cannot be
+        closed from here.
+        """
+        client, loop = self.async_api_client, self._async_client_loop
+        self.async_api_client = None
+        self._async_client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.debug(f"Error closing AsyncAnthropic client: {e}")
+
+    @classmethod
+    def close_pool(cls):
+        """
+        Close and forget all shared Anthropic clients.
+
+        ``end_client()`` leaves the shared client open because other ClaudeClient
+        instances may still use it; call this to release all pooled connections.
+        """
+        with _client_pool_lock:
+            clients = list(_client_pool.values())
+            _client_pool.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing Anthropic client: {e}")
+
+    def _is_retryable_error(self, exception: Exception) -> bool:
+        """
+        Retry only transient Anthropic errors.
+
+        Connection errors and timeouts are retried, as are status errors for rate
+        limits (429) and server-side failures (5xx, including 529 overloaded).
+        Client errors such as invalid keys or unknown models fail immediately.
+        """
+        if isinstance(exception, anthropic.APIStatusError):
+            return (
+                exception.status_code == 429
+                or exception.status_code >= 500
+                or is_rate_limit_error(exception)
+            )
+        return True
+
+    def end_client(self):
+        """
+        End the client session and record the end time.
+
+        The shared sync Anthropic client stays open for other instances;
+        use close_pool() to release it. The async client is dropped without
+        closing it; await aend_client() from async code to close it.
+        """
+        self.async_api_client = None
+        self._async_client_loop = None
+        super().end_client()
+
+    def _load_image_base64(self, resource: str) -> Optional[str]:
+        """
+        Load an image from a URL or a local file as a base64 string.
+
+        Local files are streamed through the encoder so the raw bytes are never
+        held in memory alongside the encoded copy.
+
+        Args:
+            resource: Image URL or local file path
+
+        Returns:
+            Base64-encoded image data, or None if the image could not be loaded
+        """
+        try:
+            if self.is_url(resource):
+                response = _http_session.get(resource, timeout=30)
+                if response.status_code != 200:
+                    logger.error(
+                        f"Failed to fetch image from URL {resource}: {response.status_code}"
+                    )
+                    return None
+                return b64encode_bytes(response.content)
+
+            return b64encode_file(resource)
+        except Exception as e:
+            logger.error(f"Error processing image {resource}: {e}")
+            return None
+
+    def _prepare_image_blocks(self, images: List[str], cache_images: bool = False) -> List[dict]:
+        """
+        Build Anthropic image content blocks for a list of image paths/URLs.
+
+        URL images are passed to Anthropic as ``url`` sources so Claude fetches
+        them directly; set ``prefer_url_images=False`` in the client settings to
+        download and inline them as base64 instead (e.g. for private URLs).
+
+        Images that need loading are loaded concurrently (downloads and file
+        reads are I/O bound), but the returned blocks keep the order of
+        ``images``. Images that fail to load are logged and skipped.
+
+        Args:
+            images: List of image paths/URLs
+            cache_images: If True, mark ALL images with cache_control for prompt caching
+
+        Returns:
+            List of image content blocks for Anthropic API
+        """
+        if not images:
+            return []
+
+        if self.settings.get("prefer_url_images", True):
+            is_url = self.is_url
+            to_load = [resource for resource in images if not is_url(resource)]
+        else:
+            to_load = list(images)
+
+        if len(to_load) <= 1:
+            loaded = [self._load_image_base64(resource) for resource in to_load]
+        else:
+            workers = min(len(to_load), _MAX_IMAGE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._load_image_base64, to_load))
+        image_data = dict(zip(to_load, loaded))
+
+        image_parts = []
+        for resource in images:
+            if resource in image_data:
+                data = image_data[resource]
+                if data is None:
+                    continue
+                source = {
+                    "type": "base64",
+                    "media_type": detect_image_mime_type(resource),
+                    "data": data,
+                }
+            else:
+                source = {"type": "url", "url": resource}
+
+            image_block = {"type": "image", "source": source}
+
+            if cache_images:
+                image_block["cache_control"] = {"type": "ephemeral"}
+                logger.info(f"Marking image for prompt caching: {resource}")
+
+            image_parts.append(image_block)
+
+        return image_parts
 
     def _prepare_content_with_images(
         self,
@@ -67,45 +363,7 @@ class ClaudeClient(BaseAIClient):
         """
         prompt_parts = [{"type": "text", "text": prompt}]
         files_parts = [{"type": "text", "text": file_content}] if file_content else []
-        image_parts = []
-
-        for resource in images:
-            try:
-                if self.is_url(resource):
-                    import requests
-
-                    response = requests.get(resource)
-                    if response.status_code == 200:
-                        base64_image = base64.b64encode(response.content).decode("utf-8")
-                    else:
-                        logger.error(
-                            f"Failed to fetch image from URL {resource}: {response.status_code}"
-                        )
-                        continue
-                else:
-                    with open(resource, "rb") as image_file:
-                        base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-
-                from .utils import detect_image_mime_type
-
-                media_type = detect_image_mime_type(resource)
-
-                image_block = {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": base64_image,
-                    },
-                }
-
-                if cache_images:
-                    image_block["cache_control"] = {"type": "ephemeral"}
-                    logger.info(f"Marking image for prompt caching: {resource}")
-
-                image_parts.append(image_block)
-            except Exception as e:
-                logger.error(f"Error processing image {resource}: {e}")
+        image_parts = self._prepare_image_blocks(images, cache_images)
 
         return self._order_content_parts(
             {"prompt": prompt_parts, "images": image_parts, "files": files_parts},
@@ -143,6 +401,114 @@ class ClaudeClient(BaseAIClient):
         Returns:
             LLMResponse object with the provider's response
         """
+        params = self._build_request_params(
+            model,
+            prompt,
+            messages,
+            images,
+            system_prompt,
+            response_format,
+            cache,
+            file_content,
+            **kwargs,
+        )
+
+        # Handle structured output using tools
+        if response_format and hasattr(response_format, "model_json_schema"):
+            try:
+                raw_response = self.api_client.messages.create(**params)
+                return self._create_response_from_tool(raw_response, model, response_format)
+            except Exception as e:
+                logger.warning(
+                    f"Structured output via tools failed: {e}. Falling back to text mode."
+                )
+                # Remove tools and try again
+                del params["tools"]
+                del params["tool_choice"]
+
+        # Send the request to Anthropic
+        raw_response = self.api_client.messages.create(**params)
+
+        return self._create_response_from_raw(raw_response, model)
+
+    async def _do_prompt_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: Optional[List[dict]] = None,
+        images: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Any] = None,
+        cache: bool = False,
+        file_content: str = "",
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Async version of _do_prompt using the AsyncAnthropic client.
+
+        Request parameters are built in the default executor because loading
+        images involves blocking downloads and file reads.
+
+        Returns:
+            LLMResponse object with the provider's response
+        """
+        loop = asyncio.get_running_loop()
+        params = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self._build_request_params,
+                model,
+                prompt,
+                messages,
+                images,
+                system_prompt,
+                response_format,
+                cache,
+                file_content,
+                **kwargs,
+            ),
+        )
+        async_client = self._get_async_client()
+
+        # Handle structured output using tools
+        if response_format and hasattr(response_format, "model_json_schema"):
+            try:
+                raw_response = await async_client.messages.create(**params)
+                return self._create_response_from_tool(raw_response, model, response_format)
+            except Exception as e:
+                logger.warning(
+                    f"Structured output via tools failed: {e}. Falling back to text mode."
+                )
+                # Remove tools and try again
+                del params["tools"]
+                del params["tool_choice"]
+
+        # Send the request to Anthropic
+        raw_response = await async_client.messages.create(**params)
+
+        return self._create_response_from_raw(raw_response, model)
+
+    def _build_request_params(
+        self,
+        model: str,
+        prompt: str,
+        messages: Optional[List[dict]] = None,
+        images: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Any] = None,
+        cache: bool = False,
+        file_content: str = "",
+        **kwargs,
+    ) -> dict:
+        """
+        Build the keyword arguments for ``messages.create``.
+
+        Takes the same arguments as _do_prompt. When ``response_format`` is a
+        Pydantic model, the structured-output tool and ``tool_choice`` are included.
+
+        Returns:
+            Dictionary of Messages API parameters
+        """
         images = images or []
         content_order = kwargs.pop("_content_order", None)
 
@@ -177,51 +543,7 @@ class ClaudeClient(BaseAIClient):
                     and i == len(messages) - 1
                     and (images or file_content_for_user)
                 ):
-                    image_parts = []
-                    for resource in images:
-                        try:
-                            if self.is_url(resource):
-                                import requests
-
-                                response = requests.get(resource)
-                                if response.status_code == 200:
-                                    base64_image = base64.b64encode(response.content).decode(
-                                        "utf-8"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"Failed to fetch image from URL {resource}: {response.status_code}"
-                                    )
-                                    continue
-                            else:
-                                with open(resource, "rb") as image_file:
-                                    base64_image = base64.b64encode(image_file.read()).decode(
-                                        "utf-8"
-                                    )
-
-                            from .utils import detect_image_mime_type
-
-                            media_type = detect_image_mime_type(resource)
-
-                            image_block = {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": base64_image,
-                                },
-                            }
-
-                            if cache:
-                                image_block["cache_control"] = {"type": "ephemeral"}
-                                logger.info(
-                                    f"Marking image for prompt caching in conversation: {resource}"
-                                )
-
-                            image_parts.append(image_block)
-                        except Exception as e:
-                            logger.error(f"Error processing image {resource}: {e}")
-
+                    image_parts = self._prepare_image_blocks(images, cache)
                     files_parts = (
                         [{"type": "text", "text": file_content_for_user}]
                         if file_content_for_user
@@ -249,13 +571,11 @@ class ClaudeClient(BaseAIClient):
             )
             api_messages = [{"role": "user", "content": content}]
 
-        # Determine max_tokens based on model
-        if "opus" in model.lower():
-            default_max_tokens = 4096
-        elif "sonnet" in model.lower():
-            default_max_tokens = 8192
-        else:
-            default_max_tokens = 4096
+        # Determine max_tokens based on model tier
+        tier = _MODEL_TIER_RE.search(model)
+        default_max_tokens = _MODEL_MAX_TOKENS.get(
+            tier.group(1).lower() if tier else "", _DEFAULT_MAX_TOKENS
+        )
 
         # Extract Claude-specific parameters
         params = {
@@ -297,34 +617,9 @@ class ClaudeClient(BaseAIClient):
 
         # Handle structured output using tools
         if response_format and hasattr(response_format, "model_json_schema"):
-            json_schema = response_format.model_json_schema()
-
-            tools = [
-                {
-                    "name": "extract_structured_data",
-                    "description": "Extract structured data according to the provided schema",
-                    "input_schema": json_schema,
-                }
-            ]
-
-            params["tools"] = tools
-            params["tool_choice"] = {"type": "tool", "name": "extract_structured_data"}
-
-            try:
-                raw_response = self.api_client.messages.create(**params)
-                return self._create_response_from_tool(raw_response, model, response_format)
-            except Exception as e:
-                logger.warning(
-                    f"Structured output via tools failed: {e}. Falling back to text mode."
-                )
-                # Remove tools and try again
-                del params["tools"]
-                del params["tool_choice"]
-
-        # Send the request to Anthropic
-        raw_response = self.api_client.messages.create(**params)
+            params["tools"], params["tool_choice"] = _structured_output_params(response_format)
 
-        return self._create_response_from_raw(raw_response, model)
+        return params
 
     def _create_response_from_tool(
         self, raw_response: Any, model: str, response_format: Any
@@ -340,38 +635,45 @@ class ClaudeClient(BaseAIClient):
         Returns:
             LLMResponse object
         """
-        # Extract tool use from response
-        text = ""
-        parsed_data = None
-        for block in raw_response.content:
-            if block.type == "tool_use" and block.name == "extract_structured_data":
-                try:
-                    # Validate with Pydantic and convert to JSON
-                    structured = response_format(**block.input)
-                    text = structured.model_dump_json()
-                    parsed_data = block.input  # Store the parsed dict
-                except Exception as e:
-                    logger.warning(f"Pydantic validation failed: {e}")
-                    # Use raw tool input without validation
-                    text = json.dumps(block.input)
-                    parsed_data = block.input  # Still store it as parsed
-                break
-            elif block.type == "text":
-                text = block.text
-                # Try to extract JSON from text (works with or without response_format)
-                if not parsed_data:  # Only if not already set from tool use
-                    parsed_data = extract_json_from_text(text)
+        # Prefer the structured-output tool call; fall back to the last text block
+        tool_block = next(
+            (
+                block
+                for block in raw_response.content
+                if block.type == "tool_use" and block.name == "extract_structured_data"
+            ),
+            None,
+        )
+        if tool_block is not None:
+            parsed_data = tool_block.input
+            try:
+                # Validate with Pydantic and convert to JSON
+                structured = response_format(**tool_block.input)
+                text = structured.model_dump_json()
+            except Exception as e:
+                logger.warning(f"Pydantic validation failed: {e}")
+                # Use raw tool input without validation
+                text = json_dumps(tool_block.input)
+        else:
+            text = next(
+                (block.text for block in reversed(raw_response.content) if block.type == "text"),
+                "",
+            )
+            # Try to extract JSON from text (works with or without response_format)
+            parsed_data = extract_json_from_text(text)
 
         usage = Usage()
-        if hasattr(raw_response, "usage") and raw_response.usage:
+        u = getattr(raw_response, "usage", None)
+        if u:
+            input_tokens, output_tokens = u.input_tokens, u.output_tokens
             # Extract Claude cache tokens
-            cache_creation_tokens = getattr(raw_response.usage, "cache_creation_input_tokens", 0)
-            cache_read_tokens = getattr(raw_response.usage, "cache_read_input_tokens", 0)
+            cache_creation_tokens = getattr(u, "cache_creation_input_tokens", 0)
+            cache_read_tokens = getattr(u, "cache_read_input_tokens", 0)
 
             usage = Usage(
-                input_tokens=raw_response.usage.input_tokens,
-                output_tokens=raw_response.usage.output_tokens,
-                total_tokens=raw_response.usage.input_tokens + raw_response.usage.output_tokens,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
                 cache_creation_tokens=cache_creation_tokens,
                 cache_read_tokens=cache_read_tokens,
             )
@@ -386,8 +688,8 @@ class ClaudeClient(BaseAIClient):
             costs = calculate_cost(
                 self.PROVIDER_ID,
                 model,
-                usage.input_tokens,
-                usage.output_tokens,
+                input_tokens,
+                output_tokens,
             )
             if costs is not None:
                 usage.input_cost_usd, usage.output_cost_usd, usage.estimated_cost_usd = costs
@@ -413,36 +715,32 @@ class ClaudeClient(BaseAIClient):
         Returns:
             LLMResponse object
         """
-        # Extract text and tool calls from content blocks
-        text = ""
-        tool_calls = []
-        if raw_response.content:
-            for block in raw_response.content:
-                if block.type == "text":
-                    text = block.text
-                elif block.type == "tool_use":
-                    # Claude uses tool_use blocks for tool calls
-                    tool_calls.append(
-                        {
-                            "id": block.id,
-                            "name": block.name,
-                            "arguments": block.input,
-                        }
-                    )
+        # Extract text and tool calls from content blocks; the last text block is the
+        # final answer (earlier ones are narration before tool calls)
+        content = raw_response.content or []
+        text = next((block.text for block in reversed(content) if block.type == "text"), "")
+        # Claude uses tool_use blocks for tool calls
+        tool_calls = [
+            {"id": block.id, "name": block.name, "arguments": block.input}
+            for block in content
+            if block.type == "tool_use"
+        ]
 
         # Try to extract JSON from text
         parsed_data = extract_json_from_text(text)
 
         usage = Usage()
-        if hasattr(raw_response, "usage") and raw_response.usage:
+        u = getattr(raw_response, "usage", None)
+        if u:
+            input_tokens, output_tokens = u.input_tokens, u.output_tokens
             # Extract Claude cache tokens
-            cache_creation_tokens = getattr(raw_response.usage, "cache_creation_input_tokens", 0)
-            cache_read_tokens = getattr(raw_response.usage, "cache_read_input_tokens", 0)
+            cache_creation_tokens = getattr(u, "cache_creation_input_tokens", 0)
+            cache_read_tokens = getattr(u, "cache_read_input_tokens", 0)
 
             usage = Usage(
-                input_tokens=raw_response.usage.input_tokens,
-                output_tokens=raw_response.usage.output_tokens,
-                total_tokens=raw_response.usage.input_tokens + raw_response.usage.output_tokens,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
                 cache_creation_tokens=cache_creation_tokens,
                 cache_read_tokens=cache_read_tokens,
             )
@@ -457,8 +755,8 @@ class ClaudeClient(BaseAIClient):
             costs = calculate_cost(
                 self.PROVIDER_ID,
                 model,
-                usage.input_tokens,
-                usage.output_tokens,
+                input_tokens,
+                output_tokens,
             )
             if costs is not None:
                 usage.input_cost_usd, usage.output_cost_usd, usage.estimated_cost_usd = costs
@@ -484,17 +782,11 @@ class ClaudeClient(BaseAIClient):
         if self.api_client is None:
             raise ValueError("Claude client is not initialized.")
 
-        model_list = []
         raw_list = self.api_client.models.list()
 
-        for model in raw_list:
-            try:
-                readable_date = datetime.fromisoformat(str(model.created_at)).strftime("%Y-%m-%d")
-            except (ValueError, TypeError, AttributeError):
-                readable_date = None
-            model_list.append((model.id, readable_date))
-
-        return model_list
+        return [
+            (model.id, _format_created_at(getattr(model, "created_at", None))) for model in raw_list
+        ]
 
     def _build_tool_messages(
         self,
@@ -37,6 +37,16 @@ class DeepSeekClient(OpenAIClient):
         # Call parent initialization
         super()._init_client()
 
+    def _supported_images(self, model: str, images: Optional[List[str]]) -> Optional[List[str]]:
+        """Drop images for non-VL DeepSeek models, which do not accept image inputs."""
+        if images and not any(kw in model.lower() for kw in _VISION_MODEL_KEYWORDS):
+            logger.warning(
+                f"DeepSeek model '{model}' does not support image inputs "
+                f"(only VL models do). Images will be ignored."
+            )
+            return []
+        return images
+
     def _do_prompt(
         self,
         model: str,
@@ -50,18 +60,36 @@ class DeepSeekClient(OpenAIClient):
         **kwargs,
     ) -> LLMResponse:
         """Strip images for non-VL DeepSeek models before delegating to OpenAIClient."""
-        if images and not any(kw in model.lower() for kw in _VISION_MODEL_KEYWORDS):
-            logger.warning(
-                f"DeepSeek model '{model}' does not support image inputs "
-                f"(only VL models do). Images will be ignored."
-            )
-            images = []
-
         return super()._do_prompt(
             model=model,
             prompt=prompt,
             messages=messages,
-            images=images,
+            images=self._supported_images(model, images),
+            system_prompt=system_prompt,
+            response_format=response_format,
+            cache=cache,
+            file_content=file_content,
+            **kwargs,
+        )
+
+    async def _do_prompt_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: Optional[List[dict]] = None,
+        images: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Any] = None,
+        cache: bool = False,
+        file_content: str = "",
+        **kwargs,
+    ) -> LLMResponse:
+        """Async version of _do_prompt."""
+        return await super()._do_prompt_async(
+            model=model,
+            prompt=prompt,
+            messages=messages,
+            images=self._supported_images(model, images),
             system_prompt=system_prompt,
             response_format=response_format,
             cache=cache,
@@ -8,21 +8,67 @@ multimodal content (text + images).
 Also used for OpenAI-compatible APIs like OpenRouter and sciCORE.
 """
 
-import base64
+import asyncio
+import functools
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Tuple, Any, Optional
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, List, Tuple, Any, Optional
 
 from .base_client import BaseAIClient
 from .response import LLMResponse, Usage
 from .pricing import calculate_cost
-from .utils import extract_json_from_text
+from .utils import (
+    b64encode_file,
+    detect_image_mime_type,
+    extract_json_from_text,
+    json_dumps,
+    json_schema_for,
+    sniff_image_mime_type,
+)
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent local image encodes
+_MAX_IMAGE_WORKERS = 8
+
+# The openai package takes a few hundred milliseconds to import, so its client
+# classes are loaded on first use (see __getattr__)
+_LAZY_SDK_NAMES = ("OpenAI", "AsyncOpenAI")
+
+
+def __getattr__(name: str) -> Any:
+    """Import OpenAI / AsyncOpenAI from the openai package on first access."""
+    if name in _LAZY_SDK_NAMES:
+        import openai
+
+        value = getattr(openai, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _sdk_class(name: str) -> "type[OpenAI | AsyncOpenAI]":
+    """Return an OpenAI SDK client class, importing it if it has not been loaded yet."""
+    cls = globals().get(name)
+    return cls if cls is not None else __getattr__(name)
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_prompt_for(cls: Any) -> Optional[str]:
+    """Return the JSON-mode schema instruction for a response model, built once per class."""
+    schema_dict = json_schema_for(cls)
+    if not schema_dict:
+        return None
+    return f"\n\nYou MUST respond with valid JSON matching this exact schema: {json_dumps(schema_dict)}"
+
 
 class OpenAIClient(BaseAIClient):
     """
@@ -43,9 +89,24 @@ class OpenAIClient(BaseAIClient):
     PROVIDER_ID = "openai"
     SUPPORTS_MULTIMODAL = True
     SUPPORTS_TOOLS = True
+    SUPPORTS_NATIVE_ASYNC = True  # prompt_async uses AsyncOpenAI for chat requests
+
+    # Upper bound on the total size of cached image data URIs per client
+    IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
     def _init_client(self):
         """Initialize the OpenAI client with the provided API key and optional base URL."""
+        self.api_client = _sdk_class("OpenAI")(**self._client_kwargs())
+        self.async_api_client = None
+        self._async_client_loop = None
+
+        # Encoded image cache: (path, mtime_ns, size) -> data URI, evicted by total size
+        self._image_uri_cache: OrderedDict = OrderedDict()
+        self._image_uri_cache_bytes = 0
+        self._image_uri_cache_lock = threading.Lock()
+
+    def _client_kwargs(self) -> dict:
+        """Build the keyword arguments shared by the sync and async OpenAI clients."""
         kwargs = {"api_key": self.api_key}
 
         # Support custom base URLs (for OpenRouter, sciCORE, etc.)
@@ -56,7 +117,141 @@ class OpenAIClient(BaseAIClient):
         if "default_headers" in self.settings:
             kwargs["default_headers"] = self.settings["default_headers"]
 
-        self.api_client = OpenAI(**kwargs)
+        return kwargs
+
+    def _get_async_client(self) -> "AsyncOpenAI":
+        """
+        Get the AsyncOpenAI client, creating it on first use.
+
+        The async client's connections belong to the event loop they were opened
+        on, so a new client is created whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_api_client is None or self._async_client_loop is not loop:
+            self.async_api_client = _sdk_class("AsyncOpenAI")(**self._client_kwargs())
+            self._async_client_loop = loop
+        return self.async_api_client
+
+    async def _close_async_client(self):
+        """
+        Close the AsyncOpenAI client opened on the running loop.
+
+        A client from another loop is only dropped: its connections cannot be
+        closed from here.
+        """
+        client, loop = self.async_api_client, self._async_client_loop
+        self.async_api_client = None
+        self._async_client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.debug(f"Error closing AsyncOpenAI client: {e}")
+
+    def _is_retryable_error(self, exception: Exception) -> bool:
+        """
+        Retry only transient OpenAI errors.
+
+        Connection errors and timeouts are retried, as are status errors for rate
+        limits (429) and server-side failures (5xx). Other status errors, such as
+        invalid requests, invalid keys or unknown models, fail immediately. The
+        status code is read by attribute so the openai package stays lazily imported.
+        """
+        status_code = getattr(exception, "status_code", None)
+        if status_code is None:
+            return True
+        return status_code == 429 or status_code >= 500
+
+    def end_client(self):
+        """
+        End the client session and drop the async client.
+
+        The async client is not closed; await aend_client() from async code to close it.
+        """
+        self.async_api_client = None
+        self._async_client_loop = None
+        super().end_client()
+
+    def _encode_image_data_uri(self, resource: str) -> Optional[str]:
+        """
+        Encode a local image file as a base64 ``data:`` URI.
+
+        The file is streamed straight into a buffer that already holds the URI
+        prefix, so the raw bytes and the encoded string are never copied again.
+        Results are cached per client, keyed on the file's path, modification
+        time and size, so images reused across prompts are read and encoded once.
+        The cache evicts least recently used entries beyond IMAGE_CACHE_MAX_BYTES.
+
+        Args:
+            resource: Local image file path
+
+        Returns:
+            The data URI, or None if the file could not be read
+        """
+        try:
+            stat = os.stat(resource)
+            key = (os.path.abspath(resource), stat.st_mtime_ns, stat.st_size)
+
+            with self._image_uri_cache_lock:
+                cached = self._image_uri_cache.get(key)
+                if cached is not None:
+                    self._image_uri_cache.move_to_end(key)
+                    return cached
+
+            # Trust the file's magic bytes over its extension (falling back to it); the
+            # header is sniffed and the file encoded through a single open handle
+            with open(resource, "rb") as f:
+                head = f.read(12)
+                mime_type = sniff_image_mime_type(head) or detect_image_mime_type(resource)
+                f.seek(0)
+                data_uri = b64encode_file(f, prefix=f"data:{mime_type};base64,")
+        except Exception as e:
+            logger.error(f"Error reading image file {resource}: {e}")
+            return None
+
+        if len(data_uri) <= self.IMAGE_CACHE_MAX_BYTES:
+            with self._image_uri_cache_lock:
+                previous = self._image_uri_cache.pop(key, None)
+                if previous is not None:
+                    self._image_uri_cache_bytes -= len(previous)
+                self._image_uri_cache[key] = data_uri
+                self._image_uri_cache_bytes += len(data_uri)
+                while self._image_uri_cache_bytes > self.IMAGE_CACHE_MAX_BYTES:
+                    _, evicted = self._image_uri_cache.popitem(last=False)
+                    self._image_uri_cache_bytes -= len(evicted)
+
+        return data_uri
+
+    def _image_urls(self, images: List[str]) -> List[str]:
+        """
+        Resolve images to the URLs sent to OpenAI.
+
+        URLs are passed through and local files become base64 data URIs. Local
+        files are encoded concurrently, but the result keeps the order of
+        ``images``; files that cannot be read are logged and skipped.
+
+        Args:
+            images: List of image paths/URLs
+
+        Returns:
+            List of image URLs and data URIs
+        """
+        is_url = self.is_url
+        local = [resource for resource in images if not is_url(resource)]
+
+        if len(local) > 1:
+            workers = min(len(local), _MAX_IMAGE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                encoded = dict(zip(local, executor.map(self._encode_image_data_uri, local)))
+        else:
+            encoded = {resource: self._encode_image_data_uri(resource) for resource in local}
+
+        urls = []
+        for resource in images:
+            url = resource if is_url(resource) else encoded[resource]
+            if url is not None:
+                urls.append(url)
+        return urls
 
     def _prepare_message_with_images(
         self,
@@ -81,28 +276,9 @@ class OpenAIClient(BaseAIClient):
         """
         prompt_parts = [{"type": "text", "text": prompt}]
         files_parts = [{"type": "text", "text": file_content}] if file_content else []
-        image_parts = []
-
-        for resource in images:
-            if self.is_url(resource):
-                image_parts.append({"type": "image_url", "image_url": {"url": resource}})
-            else:
-                try:
-                    with open(resource, "rb") as image_file:
-                        image_data = image_file.read()
-                        base64_image = base64.b64encode(image_data).decode("utf-8")
-
-                    from .utils import detect_image_mime_type
-
-                    mime_type = detect_image_mime_type(resource)
-                    image_parts.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": f"data:{mime_type};base64,{base64_image}"},
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error reading image file {resource}: {e}")
+        image_parts = [
+            {"type": "image_url", "image_url": {"url": url}} for url in self._image_urls(images)
+        ]
 
         user_content = self._order_content_parts(
             {"prompt": prompt_parts, "images": image_parts, "files": files_parts},
@@ -152,8 +328,142 @@ class OpenAIClient(BaseAIClient):
         Returns:
             LLMResponse object with the provider's response
         """
-        # Handle conversation messages
         images = images or []
+        params, api_style = self._build_chat_params(
+            model, prompt, messages, images, system_prompt, file_content, kwargs
+        )
+
+        # Route to the appropriate endpoint before any chat-specific handling
+        if api_style == "completions":
+            return self._do_completions_api(params, model, response_format)
+        if api_style == "responses":
+            return self._do_responses_api(
+                params, model, prompt, images, file_content, system_prompt, response_format, kwargs
+            )
+
+        if self._prepare_chat_request(params, response_format, kwargs):
+            # Use beta.chat.completions.parse for Pydantic v2 structured output
+            try:
+                raw_response = self.api_client.beta.chat.completions.parse(**params)
+                return self._create_response_from_parsed(raw_response, model)
+            except Exception as e:
+                if self._structured_output_failed(e, params, model, response_format):
+                    return self._do_completions_api(params, model, response_format)
+
+        # Send the request to OpenAI
+        try:
+            raw_response = self.api_client.chat.completions.create(**params)
+        except Exception as e:
+            if self._falls_back_to_completions(e, params, model):
+                return self._do_completions_api(params, model, response_format)
+            raise
+
+        return self._create_response_from_raw(raw_response, model, response_format)
+
+    async def _do_prompt_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: Optional[List[dict]] = None,
+        images: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Any] = None,
+        cache: bool = False,
+        file_content: str = "",
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Async version of _do_prompt using the AsyncOpenAI client.
+
+        Chat requests are sent with AsyncOpenAI. The Responses API and legacy
+        completions endpoints (api_style "responses"/"completions") run the sync
+        _do_prompt in the default executor instead.
+
+        Returns:
+            LLMResponse object with the provider's response
+        """
+        api_style = kwargs.get("api_style", self.settings.get("api_style", "chat"))
+        if api_style in ("completions", "responses"):
+            return await super()._do_prompt_async(
+                model=model,
+                prompt=prompt,
+                messages=messages,
+                images=images,
+                system_prompt=system_prompt,
+                response_format=response_format,
+                cache=cache,
+                file_content=file_content,
+                **kwargs,
+            )
+
+        # Building the messages encodes local images, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        params, _ = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self._build_chat_params,
+                model,
+                prompt,
+                messages,
+                images or [],
+                system_prompt,
+                file_content,
+                kwargs,
+            ),
+        )
+        async_client = self._get_async_client()
+
+        if self._prepare_chat_request(params, response_format, kwargs):
+            # Use beta.chat.completions.parse for Pydantic v2 structured output
+            try:
+                raw_response = await async_client.beta.chat.completions.parse(**params)
+                return self._create_response_from_parsed(raw_response, model)
+            except Exception as e:
+                if self._structured_output_failed(e, params, model, response_format):
+                    return await loop.run_in_executor(
+                        None, self._do_completions_api, params, model, response_format
+                    )
+
+        # Send the request to OpenAI
+        try:
+            raw_response = await async_client.chat.completions.create(**params)
+        except Exception as e:
+            if self._falls_back_to_completions(e, params, model):
+                return await loop.run_in_executor(
+                    None, self._do_completions_api, params, model, response_format
+                )
+            raise
+
+        return self._create_response_from_raw(raw_response, model, response_format)
+
+    def _build_chat_params(
+        self,
+        model: str,
+        prompt: str,
+        messages: Optional[List[dict]],
+        images: List[str],
+        system_prompt: Optional[str],
+        file_content: str,
+        kwargs: dict,
+    ) -> Tuple[dict, str]:
+        """
+        Build the chat completions request parameters.
+
+        Pops the internal ``_content_order`` and ``api_style`` entries from kwargs.
+
+        Args:
+            model: The OpenAI model identifier
+            prompt: The text prompt to send
+            messages: Optional conversation history (multi-turn)
+            images: List of image paths/URLs to include
+            system_prompt: System prompt to use
+            file_content: Content from files
+            kwargs: Additional OpenAI-specific parameters (see _do_prompt)
+
+        Returns:
+            Tuple of (request parameters, api_style)
+        """
+        # Handle conversation messages
         content_order = kwargs.pop("_content_order", None)
         api_style = kwargs.pop("api_style", self.settings.get("api_style", "chat"))
 
@@ -168,30 +478,10 @@ class OpenAIClient(BaseAIClient):
             # Add conversation messages, attaching images and files to the last user message
             for i, msg in enumerate(messages):
                 if msg["role"] == "user" and i == len(messages) - 1 and (images or file_content):
-                    image_parts = []
-                    for resource in images:
-                        if self.is_url(resource):
-                            image_parts.append(
-                                {"type": "image_url", "image_url": {"url": resource}}
-                            )
-                        else:
-                            try:
-                                with open(resource, "rb") as image_file:
-                                    image_data = image_file.read()
-                                    base64_image = base64.b64encode(image_data).decode("utf-8")
-                                from .utils import detect_image_mime_type
-
-                                mime_type = detect_image_mime_type(resource)
-                                image_parts.append(
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:{mime_type};base64,{base64_image}"
-                                        },
-                                    }
-                                )
-                            except Exception as e:
-                                logger.error(f"Error reading image file {resource}: {e}")
+                    image_parts = [
+                        {"type": "image_url", "image_url": {"url": url}}
+                        for url in self._image_urls(images)
+                    ]
 
                     files_parts = [{"type": "text", "text": file_content}] if file_content else []
                     content = self._order_content_parts(
@@ -243,15 +533,61 @@ class OpenAIClient(BaseAIClient):
             if value is not None:
                 params[param] = value
 
-        # Route to the appropriate endpoint before any chat-specific handling
-        if api_style == "completions":
-            return self._do_completions_api(params, model, response_format)
-        if api_style == "responses":
-            return self._do_responses_api(
-                params, model, prompt, images, file_content, system_prompt, response_format, kwargs
-            )
+        return params, api_style
 
-        # Handle tool calling
+    def _prepare_chat_request(self, params: dict, response_format: Any, kwargs: dict) -> bool:
+        """
+        Add tool and structured output settings to chat completion parameters.
+
+        Shared by _do_prompt and _do_prompt_async.
+
+        Returns:
+            True if the request should first be sent to beta.chat.completions.parse
+            (Pydantic v2 models); False if it goes straight to chat.completions.create
+        """
+        self._add_tool_params(params, kwargs)
+
+        if not response_format:
+            return False
+        if hasattr(response_format, "model_json_schema"):
+            params["response_format"] = response_format
+            return True
+        self._add_json_mode_params(params, response_format)
+        return False
+
+    def _structured_output_failed(
+        self, error: Exception, params: dict, model: str, response_format: Any
+    ) -> bool:
+        """
+        Handle a failed beta.chat.completions.parse call.
+
+        Returns:
+            True if the model needs the v1/completions endpoint instead; otherwise
+            the parameters are switched to JSON object mode and False is returned
+        """
+        if self._falls_back_to_completions(error, params, model):
+            return True
+        logger.warning(f"Structured output failed, falling back to JSON mode: {error}")
+        self._add_json_mode_params(params, response_format)
+        return False
+
+    def _falls_back_to_completions(self, error: Exception, params: dict, model: str) -> bool:
+        """
+        Check whether a chat request failed because the model only supports v1/completions.
+
+        If so, the chat-only ``response_format`` parameter is removed from ``params``.
+        """
+        if not self._is_non_chat_model_error(error):
+            return False
+        logger.warning(
+            f"Model {model} does not support chat completions, "
+            f"falling back to v1/completions: {error}"
+        )
+        params.pop("response_format", None)
+        return True
+
+    def _add_tool_params(self, params: dict, kwargs: dict) -> None:
+        """Add registry tool definitions (popped from kwargs) to the request parameters."""
         tool_definitions = kwargs.pop("_tool_definitions", None)
         if tool_definitions:
             # Convert to OpenAI tools format
@@ -268,78 +604,38 @@ class OpenAIClient(BaseAIClient):
             ]
             params["tool_choice"] = "auto"
 
-        # Handle structured output
-        if response_format:
-            # Check if it's a Pydantic model (v1 or v2)
-            is_pydantic_v2 = hasattr(response_format, "model_json_schema")
-            is_pydantic_v1 = hasattr(response_format, "schema")
-
-            if is_pydantic_v2:
-                # Use beta.chat.completions.parse for Pydantic v2 structured output
-                try:
-                    params["response_format"] = response_format
-                    raw_response = self.api_client.beta.chat.completions.parse(**params)
-                    return self._create_response_from_parsed(raw_response, model)
-                except Exception as e:
-                    if self._is_non_chat_model_error(e):
-                        logger.warning(
-                            f"Model {model} does not support chat completions, "
-                            f"falling back to v1/completions: {e}"
-                        )
-                        params.pop("response_format", None)
-                        return self._do_completions_api(
-                            params, model, response_format
-                        )  # auto-fallback
-                    logger.warning(f"Structured output failed, falling back to JSON mode: {e}")
-                    # Fall through to JSON object mode
-
-            # Fallback to JSON object mode (for Pydantic v1 or when v2 parse fails)
-            params["response_format"] = {"type": "json_object"}
-
-            # Get JSON schema (support both Pydantic v1 and v2)
-            if is_pydantic_v2:
-                schema_dict = response_format.model_json_schema()
-            elif is_pydantic_v1:
-                schema_dict = response_format.schema()
-            else:
-                schema_dict = None
-
-            if schema_dict:
-                schema_prompt = f"\n\nYou MUST respond with valid JSON matching this exact schema: {json.dumps(schema_dict)}"
-
-                # Find the last user message and append the schema prompt
-                last_user_idx = None
-                for i in range(len(params["messages"]) - 1, -1, -1):
-                    if params["messages"][i].get("role") == "user":
-                        last_user_idx = i
-                        break
-
-                if last_user_idx is not None:
-                    msg = params["messages"][last_user_idx]
-                    # Handle both string and array content
-                    if isinstance(msg["content"], str):
-                        msg["content"] += schema_prompt
-                    elif isinstance(msg["content"], list):
-                        # Content is an array (multimodal) - append text block
-                        msg["content"].append({"type": "text", "text": schema_prompt})
-                else:
-                    # No user message found, add a new one
-                    params["messages"].append({"role": "user", "content": schema_prompt})
+    def _add_json_mode_params(self, params: dict, response_format: Any) -> None:
+        """
+        Switch the request to JSON object mode with the schema in the last user message.
 
-        # Send the request to OpenAI
-        try:
-            raw_response = self.api_client.chat.completions.create(**params)
-        except Exception as e:
-            if self._is_non_chat_model_error(e):
-                logger.warning(
-                    f"Model {model} does not support chat completions, "
-                    f"falling back to v1/completions: {e}"
-                )
-                params.pop("response_format", None)
-                return self._do_completions_api(params, model, response_format)
-            raise
+        Used for Pydantic v1 models and when structured output parsing fails.
+        """
+        # Fallback to JSON object mode (for Pydantic v1 or when v2 parse fails)
+        params["response_format"] = {"type": "json_object"}
 
-        return self._create_response_from_raw(raw_response, model, response_format)
+        # Schema instruction (supports both Pydantic v1 and v2)
+        schema_prompt = (
+            _schema_prompt_for(response_format) if isinstance(response_format, type) else None
+        )
+        if schema_prompt:
+            # Find the last user message and append the schema prompt
+            last_user_idx = None
+            for i in range(len(params["messages"]) - 1, -1, -1):
+                if params["messages"][i].get("role") == "user":
+                    last_user_idx = i
+                    break
+
+            if last_user_idx is not None:
+                msg = params["messages"][last_user_idx]
+                # Handle both string and array content
+                if isinstance(msg["content"], str):
+                    msg["content"] += schema_prompt
+                elif isinstance(msg["content"], list):
+                    # Content is an array (multimodal) - append text block
+                    msg["content"].append({"type": "text", "text": schema_prompt})
+            else:
+                # No user message found, add a new one
+                params["messages"].append({"role": "user", "content": schema_prompt})
 
     def _do_responses_api(
         self,
@@ -368,25 +664,9 @@ class OpenAIClient(BaseAIClient):
             content = [{"type": "input_text", "text": prompt}]
             if file_content:
                 content.append({"type": "input_text", "text": file_content})
-            for resource in images:
-                if self.is_url(resource):
-                    content.append({"type": "input_image", "image_url": resource})
-                else:
-                    try:
-                        with open(resource, "rb") as f:
-                            image_data = f.read()
-                        base64_image = base64.b64encode(image_data).decode("utf-8")
-                        from .utils import detect_image_mime_type
-
-                        mime_type = detect_image_mime_type(resource)
-                        content.append(
-                            {
-                                "type": "input_image",
-                                "image_url": f"data:{mime_type};base64,{base64_image}",
-                            }
-                        )
-                    except Exception as e:
-                        logger.error(f"Error reading image file {resource}: {e}")
+            content.extend(
+                {"type": "input_image", "image_url": url} for url in self._image_urls(images)
+            )
             input_value = [{"type": "message", "role": "user", "content": content}]
         else:
             input_value = prompt
@@ -410,7 +690,7 @@ class OpenAIClient(BaseAIClient):
 
         # Structured output via text.format
         if response_format and hasattr(response_format, "model_json_schema"):
-            schema = response_format.model_json_schema()
+            schema = json_schema_for(response_format)
             responses_params["text"] = {
                 "format": {
                     "type": "json_schema",
@@ -590,12 +870,10 @@ class OpenAIClient(BaseAIClient):
         # For structured output, the parsed object is in message.parsed
         parsed_data = None
         if hasattr(choice.message, "parsed") and choice.message.parsed:
+            # Dump the model straight to JSON-compatible data instead of
+            # re-parsing the JSON text
             text = choice.message.parsed.model_dump_json()
-            # Parse the JSON to dict/list for convenience
-            try:
-                parsed_data = json.loads(text)
-            except Exception:
-                pass
+            parsed_data = choice.message.parsed.model_dump(mode="json")
         else:
             text = choice.message.content or ""
             # Try to extract JSON even if structured output wasn't used
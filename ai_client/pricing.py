@@ -7,11 +7,15 @@ to automatically calculate estimated costs for API requests.
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Matches a trailing -YYYY-MM-DD or -YYYYMMDD date suffix on a model name
+_DATE_SUFFIX_RE = re.compile(r"-(?:\d{4}-\d{2}-\d{2}|\d{8})$")
+
 
 class PricingManager:
     """
@@ -32,6 +36,11 @@ class PricingManager:
         self.pricing_data: Dict = {}
         self.pricing_file = pricing_file
 
+        # provider -> model -> (input_price, output_price), most recent date wins
+        self._price_index: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        # (provider, model) -> lookup result, including misses (None)
+        self._lookup_cache: Dict[Tuple[str, str], Optional[Tuple[float, float]]] = {}
+
         if pricing_file is None:
             # Look for pricing.json in the package directory
             package_dir = Path(__file__).parent
@@ -58,6 +67,39 @@ class PricingManager:
             logger.error(f"Error loading pricing data: {e}")
             self.pricing_data = {}
 
+        self._build_price_index()
+
+    def _build_price_index(self):
+        """
+        Flatten the dated pricing tables into a provider -> model lookup.
+
+        Dates are applied oldest first, so the most recent price for each
+        model wins. Clears any cached lookups.
+        """
+        index: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        for date in sorted(self.pricing_data.get("pricing", {})):
+            for provider, provider_pricing in self.pricing_data["pricing"][date].items():
+                provider_index = index.setdefault(provider, {})
+                for model, model_info in provider_pricing.items():
+                    provider_index[model] = (
+                        model_info.get("input_price", 0.0),
+                        model_info.get("output_price", 0.0),
+                    )
+        self._price_index = index
+        self._lookup_cache = {}
+
+    def priced_models(self, provider: str) -> frozenset:
+        """
+        Get the model identifiers with pricing data for a provider.
+
+        Args:
+            provider: Provider ID
+
+        Returns:
+            Set of model identifiers that have pricing data
+        """
+        return frozenset(self._price_index.get(provider, ()))
+
     def get_model_pricing(self, provider: str, model: str) -> Optional[Tuple[float, float]]:
         """
         Get pricing information for a specific model.
@@ -70,50 +112,44 @@ class PricingManager:
             Tuple of (input_price_per_million, output_price_per_million) or None
             if pricing is not available
         """
+        key = (provider, model)
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+
+        pricing = self._lookup_model_pricing(provider, model)
+        self._lookup_cache[key] = pricing
+        return pricing
+
+    def _lookup_model_pricing(self, provider: str, model: str) -> Optional[Tuple[float, float]]:
+        """Look up pricing in the index, falling back to the model name without a date suffix."""
         logger.debug(f"Looking up pricing for provider='{provider}', model='{model}'")
 
-        if not self.pricing_data or "pricing" not in self.pricing_data:
+        if not self._price_index:
             logger.debug("No pricing data available")
             return None
 
-        # Get all dates and sort them in descending order (most recent first)
-        dates = sorted(self.pricing_data["pricing"].keys(), reverse=True)
+        provider_pricing = self._price_index.get(provider, {})
 
         # Try exact match first
-        for date in dates:
-            date_pricing = self.pricing_data["pricing"][date]
-            if provider in date_pricing:
-                provider_pricing = date_pricing[provider]
-                if model in provider_pricing:
-                    model_info = provider_pricing[model]
-                    input_price = model_info.get("input_price", 0.0)
-                    output_price = model_info.get("output_price", 0.0)
-                    logger.debug(
-                        f"Found pricing (exact match): input=${input_price}, output=${output_price}"
-                    )
-                    return (input_price, output_price)
+        pricing = provider_pricing.get(model)
+        if pricing is not None:
+            logger.debug(f"Found pricing (exact match): input=${pricing[0]}, output=${pricing[1]}")
+            return pricing
 
         # If no exact match, try stripping date suffixes
         # Pattern: model-YYYY-MM-DD or model-YYYYMMDD
-        import re
-
-        base_model = re.sub(r"-\d{4}-\d{2}-\d{2}$", "", model)  # Remove -YYYY-MM-DD
-        base_model = re.sub(r"-\d{8}$", "", base_model)  # Remove -YYYYMMDD
+        base_model = _DATE_SUFFIX_RE.sub("", model)
 
         if base_model != model:
             logger.debug(f"Trying base model: '{base_model}'")
-            for date in dates:
-                date_pricing = self.pricing_data["pricing"][date]
-                if provider in date_pricing:
-                    provider_pricing = date_pricing[provider]
-                    if base_model in provider_pricing:
-                        model_info = provider_pricing[base_model]
-                        input_price = model_info.get("input_price", 0.0)
-                        output_price = model_info.get("output_price", 0.0)
-                        logger.debug(
-                            f"Found pricing (base model match): input=${input_price}, output=${output_price}"
-                        )
-                        return (input_price, output_price)
+            pricing = provider_pricing.get(base_model)
+            if pricing is not None:
+                logger.debug(
+                    f"Found pricing (base model match): input=${pricing[0]}, output=${pricing[1]}"
+                )
+                return pricing
 
         # Not found
         logger.warning(
@@ -10,8 +10,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional, Union
 
+from .utils import json_dumps
 
-@dataclass
+
+@dataclass(slots=True)
 class Usage:
     """
     Token usage and cost information for an LLM request.
@@ -89,7 +91,7 @@ class Usage:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """
     Unified response object for all LLM providers.
@@ -160,6 +162,15 @@ class LLMResponse:
             result["tool_results"] = self.tool_results
         return result
 
+    def to_json(self) -> str:
+        """
+        Serialize the response to a compact JSON string (see to_dict for the fields).
+
+        Uses orjson when it is installed, which is considerably faster than the
+        standard library when logging many responses.
+        """
+        return json_dumps(self.to_dict())
+
     def __str__(self) -> str:
         """String representation shows the text content."""
         return self.text
@@ -0,0 +1,77 @@
+"""
+Response caching for repeated LLM requests.
+
+A response cache is any object with ``get(key)`` and ``set(key, response)``
+methods, passed to a client as ``response_cache=``. The client builds ``key`` as
+a dict describing the request (provider, model, prompts, images, parameters)
+plus a ``hash`` entry: the SHA-256 of that description. Exact-match caches can
+simply use ``key["hash"]``; smarter caches (e.g. semantic lookups on
+``key["prompt"]``) can use the other fields.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .response import LLMResponse
+
+
+class InMemoryResponseCache:
+    """
+    Exact-match, in-process response cache with least-recently-used eviction.
+
+    Example:
+        >>> cache = InMemoryResponseCache(max_entries=512)
+        >>> client = create_ai_client('openai', api_key='sk-...', response_cache=cache)
+        >>> client.prompt('gpt-4o', 'Hello!', temperature=0)  # calls the API
+        >>> client.prompt('gpt-4o', 'Hello!', temperature=0)  # served from the cache
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses to keep
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: dict) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Request description built by the client
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            response = self._entries.get(key["hash"])
+            if response is not None:
+                self._entries.move_to_end(key["hash"])
+            return response
+
+    def set(self, key: dict, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Request description built by the client
+            response: Response to cache
+        """
+        with self._lock:
+            self._entries[key["hash"]] = response
+            self._entries.move_to_end(key["hash"])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,69 @@
+"""
+Small in-process TTL cache for built-in tools.
+
+LLMs tend to call the same tool with the same arguments several times during
+one conversation, so successful results are kept for a while and served again
+without repeating the lookup.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict
+
+
+def ttl_cache(maxsize: int = 1024, ttl: float = 3600.0) -> Callable:
+    """
+    Cache a tool function's results per argument tuple for ``ttl`` seconds.
+
+    Results containing an ``"error"`` key are not cached, so transient failures
+    are retried on the next call. Callers get a copy of the cached result.
+    The wrapped function gains a ``cache_clear()`` method.
+
+    Args:
+        maxsize: Maximum number of results to keep (least recently used are evicted)
+        ttl: Seconds a result stays valid
+
+    Returns:
+        Decorator for the tool function
+    """
+
+    def decorator(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    expires_at, result = entry
+                    if expires_at > now:
+                        entries.move_to_end(key)
+                        return copy.deepcopy(result)
+                    del entries[key]
+
+            result = func(*args, **kwargs)
+
+            if "error" not in result:
+                with lock:
+                    entries[key] = (now + ttl, copy.deepcopy(result))
+                    entries.move_to_end(key)
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -5,24 +5,101 @@ This tool searches for geographical locations using the geonamescache package.
 Requires: pip install geonamescache
 """
 
+import heapq
+import threading
+from bisect import bisect_left
 import unicodedata
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional
 
+from ._cache import ttl_cache
 
+try:
+    import geonamescache
+except ImportError:  # Optional dependency, see search_geonames
+    geonamescache = None
+
+
+def _normalize(text: str) -> str:
+    """Lowercase text and strip accents/diacritics (uncached, see normalize_text)."""
+    # NFD = decompose accented chars into base + combining chars
+    # Then filter out combining characters (category Mn)
+    nfd = unicodedata.normalize("NFD", text.lower())
+    return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+
+
+@lru_cache(maxsize=1024)
 def normalize_text(text: str) -> str:
     """
     Normalize text by removing accents/diacritics for fuzzy matching.
 
+    Cached for search queries; the city index normalizes names once with
+    the uncached _normalize, so building it does not flush this cache.
+
     Examples:
         "Zürich" -> "zurich"
         "São Paulo" -> "sao paulo"
     """
-    # NFD = decompose accented chars into base + combining chars
-    # Then filter out combining characters (category Mn)
-    nfd = unicodedata.normalize("NFD", text.lower())
-    return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+    return _normalize(text)
 
 
+class _CityIndex(NamedTuple):
+    """
+    Column-wise (structure-of-arrays) view of the geonamescache cities.
+
+    Names are lowercased and accent-normalized once when the index is built,
+    so searches only compare precomputed strings. ``sorted_names`` holds the
+    normalized names in sorted order (with their positions in
+    ``sorted_positions``), so names sharing a prefix form a contiguous run.
+    """
+
+    geonameids: List[str]
+    names: List[str]
+    names_normalized: List[str]
+    countries: List[str]
+    populations: List[int]
+    latitudes: List[float]
+    longitudes: List[float]
+    sorted_names: List[str]
+    sorted_positions: List[int]
+
+
+_city_index: Optional[_CityIndex] = None
+_city_index_lock = threading.Lock()
+
+
+def _get_city_index() -> _CityIndex:
+    """
+    Build the city index on first use and reuse it for later searches.
+
+    The geonamescache dataset is loaded once per process; concurrent first
+    calls wait for a single build.
+    """
+    global _city_index
+    if _city_index is None:
+        with _city_index_lock:
+            # Another thread may have built the index while we waited
+            if _city_index is None:
+                cities = geonamescache.GeonamesCache().get_cities()
+                names_normalized = [_normalize(city["name"]) for city in cities.values()]
+                sorted_positions = sorted(
+                    range(len(names_normalized)), key=names_normalized.__getitem__
+                )
+                _city_index = _CityIndex(
+                    geonameids=list(cities.keys()),
+                    names=[city["name"] for city in cities.values()],
+                    names_normalized=names_normalized,
+                    countries=[city["countrycode"] for city in cities.values()],
+                    populations=[city["population"] for city in cities.values()],
+                    latitudes=[city["latitude"] for city in cities.values()],
+                    longitudes=[city["longitude"] for city in cities.values()],
+                    sorted_names=[names_normalized[i] for i in sorted_positions],
+                    sorted_positions=sorted_positions,
+                )
+    return _city_index
+
+
+@ttl_cache(maxsize=1024, ttl=3600)
 def search_geonames(query: str, max_results: int = 5) -> Dict[str, Any]:
     """
     Search for geographical locations by name.
@@ -44,9 +121,7 @@ def search_geonames(query: str, max_results: int = 5) -> Dict[str, Any]:
         >>> print(result["results"][0]["name"])
         Paris
     """
-    try:
-        import geonamescache
-    except ImportError:
+    if geonamescache is None:
         return {
             "error": "geonamescache not installed. Install with: pip install geonamescache",
             "query": query,
@@ -54,12 +129,11 @@ def search_geonames(query: str, max_results: int = 5) -> Dict[str, Any]:
             "results": [],
         }
 
-    gc = geonamescache.GeonamesCache()
-    cities = gc.get_cities()
+    index = _get_city_index()
 
     # Search by name with exact and partial matching
     # Note: get_cities() already filters to populated places (P class in GeoNames)
-    results = []
+    matches = []  # (match_score, population, index position) per matching city
     query_lower = query.lower().strip()
 
     # Extract city name if query is in "City, Country" format
@@ -71,60 +145,60 @@ def search_geonames(query: str, max_results: int = 5) -> Dict[str, Any]:
     query_normalized = normalize_text(query_lower)
     primary_normalized = normalize_text(primary_query)
 
-    for geonameid, city in cities.items():
-        city_name_lower = city["name"].lower()
-        city_name_normalized = normalize_text(city_name_lower)
-
-        # Calculate match score - check both full query and primary part
-        # Use normalized versions for accent-insensitive matching
-        if (
-            city_name_normalized == query_normalized
-            or city_name_normalized == primary_normalized
-            or city_name_lower == query_lower
-            or city_name_lower == primary_query
-        ):
+    # The primary part is a prefix of the full query, so every exact (3) or
+    # starts-with (2) match starts with it. Lowercased names need no separate
+    # checks: they match whenever their normalized form does. Those matches are
+    # a contiguous run of the sorted names, found by binary search.
+    start = bisect_left(index.sorted_names, primary_normalized)
+    for k in range(start, len(index.sorted_names)):
+        city_name_normalized = index.sorted_names[k]
+        if not city_name_normalized.startswith(primary_normalized):
+            break
+        if city_name_normalized == primary_normalized or city_name_normalized == query_normalized:
             # Exact match - highest priority
             match_score = 3
-        elif (
-            city_name_normalized.startswith(query_normalized)
-            or city_name_normalized.startswith(primary_normalized)
-            or city_name_lower.startswith(query_lower)
-            or city_name_lower.startswith(primary_query)
-        ):
+        else:
             # Starts with query - high priority
             match_score = 2
-        elif primary_normalized in city_name_normalized:
-            # Query is contained in city name (e.g., "Paris" in "Paris 11e Arrondissement")
-            match_score = 1
-        elif city_name_normalized in query_normalized and " " in city_name_normalized:
-            # City name is in query AND city name contains a space (multi-word)
-            # e.g., "Lake Zurich" in "zurich" won't match, but "New York" would
-            # This prevents single-word substrings like "Rich" matching "Zurich"
-            match_score = 1
-        else:
-            continue
-
-        results.append(
-            {
-                "geonameid": geonameid,
-                "name": city["name"],
-                "country": city["countrycode"],
-                "population": city["population"],
-                "latitude": city["latitude"],
-                "longitude": city["longitude"],
-                "feature_class": "P",  # Populated place
-                "match_score": match_score,
-            }
-        )
-
-    # Sort by match score (descending), then by population (descending)
-    results.sort(key=lambda x: (x["match_score"], x["population"]), reverse=True)
-
-    # Remove match_score from results (internal use only)
-    for r in results:
-        del r["match_score"]
-
-    # Limit to max_results
-    results = results[:max_results]
+        i = index.sorted_positions[k]
+        matches.append((match_score, index.populations[i], i))
+
+    # Lower-scored matches need a full scan, which is skipped when the
+    # exact and starts-with matches already fill max_results
+    if len(matches) < max_results:
+        for i, city_name_normalized in enumerate(index.names_normalized):
+            position = city_name_normalized.find(primary_normalized)
+            if position > 0:
+                # Query is contained in city name (e.g., "Paris" in "Paris 11e Arrondissement")
+                match_score = 1
+            elif (
+                position < 0
+                and " " in city_name_normalized
+                and city_name_normalized in query_normalized
+            ):
+                # City name is in query AND city name contains a space (multi-word)
+                # e.g., "Lake Zurich" in "zurich" won't match, but "New York" would
+                # This prevents single-word substrings like "Rich" matching "Zurich"
+                match_score = 1
+            else:
+                continue
+
+            matches.append((match_score, index.populations[i], i))
+
+    # Keep the best matches by score (descending), then by population (descending),
+    # then by dataset order, and only build result dicts for those
+    top_matches = heapq.nlargest(max_results, matches, key=lambda m: (m[0], m[1], -m[2]))
+    results = [
+        {
+            "geonameid": index.geonameids[i],
+            "name": index.names[i],
+            "country": index.countries[i],
+            "population": index.populations[i],
+            "latitude": index.latitudes[i],
+            "longitude": index.longitudes[i],
+            "feature_class": "P",  # Populated place
+        }
+        for _, _, i in top_matches
+    ]
 
     return {"query": query, "result_count": len(results), "results": results}
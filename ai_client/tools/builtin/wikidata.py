@@ -6,9 +6,34 @@ Uses the Wikidata API (no authentication required).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, List
+from urllib3.util.retry import Retry
 
+from ._cache import ttl_cache
 
+# Wikidata requires a proper User-Agent header
+# See: https://meta.wikimedia.org/wiki/User-Agent_policy
+_USER_AGENT = "ai_client/1.0 (https://github.com/your-repo; contact@example.com) python-requests"
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated lookups reuse keep-alive connections."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": _USER_AGENT})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_http_session = _create_http_session()
+
+
+@ttl_cache(maxsize=1024, ttl=3600)
 def search_wikidata(query: str, max_results: int = 5) -> Dict[str, Any]:
     """
     Search for entities in Wikidata by name.
@@ -41,13 +66,7 @@ def search_wikidata(query: str, max_results: int = 5) -> Dict[str, Any]:
             "format": "json",
         }
 
-        # Wikidata requires a proper User-Agent header
-        # See: https://meta.wikimedia.org/wiki/User-Agent_policy
-        headers = {
-            "User-Agent": "ai_client/1.0 (https://github.com/your-repo; contact@example.com) python-requests"
-        }
-
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = _http_session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -4,14 +4,88 @@ Tool registry management for ai_client.
 This module handles loading and managing tool definitions from a JSON registry file.
 """
 
+import functools
 import json
 import os
+import threading
+from importlib import resources
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, KeysView, Mapping, Optional, Tuple
+
+from ..utils import json_loads
+
+# Registry file shipped with the package
+_DEFAULT_REGISTRY_NAME = "default_tools.json"
+_DEFAULT_REGISTRY_PATH = Path(__file__).parent / _DEFAULT_REGISTRY_NAME
+
+
+def _tools_view(data: Dict[str, Any]) -> Mapping[str, Mapping[str, Any]]:
+    """Wrap the tools of a parsed registry file in read-only mappings."""
+    return MappingProxyType(
+        {name: MappingProxyType(definition) for name, definition in data.get("tools", {}).items()}
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_registry_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Parse a registry file, once per file version.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again. The result is shared between registries, hence the
+    read-only views of the registry and of each tool definition.
+
+    Args:
+        path: Resolved path of the registry file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Read-only mapping of tool names to read-only definitions
+    """
+    # Read bytes: orjson parses UTF-8 directly, without a decode step
+    with open(path, "rb") as f:
+        return _tools_view(json_loads(f.read()))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_registry() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Parse the registry shipped with the package, once per process.
+
+    The file is read as a package resource, which also works when the package
+    is imported from a zip archive, and is never stat'ed.
+
+    Returns:
+        Read-only mapping of tool names to read-only definitions
+    """
+    data = resources.files(__package__).joinpath(_DEFAULT_REGISTRY_NAME).read_bytes()
+    return _tools_view(json_loads(data))
 
 
 class ToolRegistry:
-    """Manages tool definitions from registry file."""
+    """
+    Manages tool definitions from registry file.
+
+    Registries are shared per registry file: constructing a ToolRegistry for a
+    path that was already loaded in this process returns the existing instance
+    without touching the disk. Call clear_cache() to re-read registry files.
+    """
+
+    __slots__ = ("_initialized", "_tool_names_joined", "registry_path", "tools")
+
+    # Loaded registries, keyed on (class, resolved registry path)
+    _instances: ClassVar[Dict[Tuple[type, Path], "ToolRegistry"]] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, registry_path: Optional[str] = None):
+        key = (cls, cls._resolve_registry_path(registry_path).resolve())
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+        return instance
 
     def __init__(self, registry_path: Optional[str] = None):
         """
@@ -23,31 +97,63 @@ class ToolRegistry:
         Raises:
             ToolRegistryError: If registry cannot be loaded
         """
+        if getattr(self, "_initialized", False):
+            # Shared instance returned by __new__, already loaded
+            return
+
+        self.registry_path = self._resolve_registry_path(registry_path)
+        self.tools = self._load_registry()
+        # The registry is immutable, so the error message listing is built once
+        self._tool_names_joined = ", ".join(self.tools)
+        self._initialized = True
+
+        # Only successfully loaded registries are shared
+        with self._instances_lock:
+            self._instances.setdefault((type(self), self.registry_path.resolve()), self)
+
+    @staticmethod
+    def _resolve_registry_path(registry_path: Optional[str]) -> Path:
+        """Return the registry file to use: the given path, $AI_CLIENT_TOOLS_REGISTRY or default."""
         if registry_path is None:
             # Check environment variable
             registry_path = os.environ.get("AI_CLIENT_TOOLS_REGISTRY")
 
         if registry_path is None:
             # Use default registry
-            registry_path = Path(__file__).parent / "default_tools.json"
+            registry_path = _DEFAULT_REGISTRY_PATH
 
-        self.registry_path = Path(registry_path)
-        self.tools = self._load_registry()
+        return Path(registry_path)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all loaded registries and parsed files, so registry files are read again."""
+        with cls._instances_lock:
+            cls._instances.clear()
+        _load_registry_cached.cache_clear()
+        _load_default_registry.cache_clear()
 
-    def _load_registry(self) -> Dict[str, Dict[str, Any]]:
+    def _load_registry(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Load tools from JSON file.
 
+        Parsed files are cached per (path, modification time, size), so creating
+        many registries for an unchanged file parses it only once. The default
+        registry is read once as a package resource.
+
         Returns:
-            Dictionary mapping tool names to definitions
+            Read-only mapping of tool names to read-only definitions
 
         Raises:
             ToolRegistryError: If registry cannot be loaded
         """
         try:
-            with open(self.registry_path, "r") as f:
-                data = json.load(f)
-                return data.get("tools", {})
+            if self.registry_path == _DEFAULT_REGISTRY_PATH:
+                return _load_default_registry()
+
+            stat = os.stat(self.registry_path)
+            return _load_registry_cached(
+                str(self.registry_path.resolve()), stat.st_mtime_ns, stat.st_size
+            )
         except FileNotFoundError:
             from ..utils import ToolRegistryError
 
@@ -57,15 +163,18 @@ class ToolRegistry:
 
             raise ToolRegistryError(f"Invalid JSON in registry: {e}")
 
-    def get_tool(self, name: str) -> Dict[str, Any]:
+    def get_tool(self, name: str) -> Mapping[str, Any]:
         """
         Get tool definition by name.
 
+        The definition is shared by all users of the registry and cannot be
+        modified; use dict(definition) or definition.copy() for a mutable copy.
+
         Args:
             name: Tool name from registry
 
         Returns:
-            Tool definition dictionary
+            Read-only tool definition mapping
 
         Raises:
             ToolRegistryError: If tool not found
@@ -75,15 +184,15 @@ class ToolRegistry:
 
             raise ToolRegistryError(
                 f"Tool '{name}' not found in registry. "
-                f"Available tools: {', '.join(self.list_tools())}"
+                f"Available tools: {self._tool_names_joined}"
             )
         return self.tools[name]
 
-    def list_tools(self) -> List[str]:
+    def list_tools(self) -> KeysView[str]:
         """
         List all available tool names.
 
         Returns:
-            List of tool names
+            Read-only view of the tool names (use list() for a list)
         """
-        return list(self.tools.keys())
+        return self.tools.keys()
@@ -5,15 +5,88 @@ This module provides common utilities like retry logic, rate limiting,
 and error handling for LLM API interactions.
 """
 
+import asyncio
+import base64
+import json
+import os
+import random
+import re
 import time
 import logging
-from typing import Callable, TypeVar, Optional
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, BinaryIO, Callable, TypeVar, Optional, Union
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, install with the "fast" extra
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:  # Optional speed-up, install with the "fast" extra
+    pybase64 = None
 
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Read size for streaming base64 encoding (a multiple of 3, so chunks encode without padding)
+B64_CHUNK_SIZE = 3 * 21845
+
+# read_text_files() reads files concurrently above this many files
+_PARALLEL_READ_THRESHOLD = 4
+_MAX_READ_WORKERS = 8
+
+# Image MIME types by lowercase file extension (without the dot)
+_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "bmp": "image/bmp",
+    "tiff": "image/tiff",
+    "tif": "image/tiff",
+}
+
+# Markdown code fences around JSON in model output
+_JSON_FENCE_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+_CODE_FENCE_RE = re.compile(r"```\s*([\s\S]*?)\s*```")
+
+# Provider error messages that indicate a rate limit, matched in a single pass
+_RATE_LIMIT_RE = re.compile(
+    r"rate[ _]limit|too many requests|429|quota exceeded|resource_exhausted", re.IGNORECASE
+)
+# Same indicators for raw (undecoded) error bodies
+_RATE_LIMIT_BYTES_RE = re.compile(_RATE_LIMIT_RE.pattern.encode("ascii"), re.IGNORECASE)
+
+# "retry after X", "retry in X" and "wait X seconds" hints in provider error messages
+_RETRY_DELAY_RE = re.compile(r"retry (?:after|in) (\d+)|wait (\d+) seconds", re.IGNORECASE)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    for objects orjson rejects (e.g. non-string keys or very large integers).
+    Both paths produce the same compact, non-ASCII-escaped output.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 
 class RateLimitError(Exception):
     """Raised when rate limit is exceeded."""
@@ -45,6 +118,26 @@ class ToolExecutionError(APIError):
     pass
 
 
+def json_loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson when it is installed (it parses UTF-8 bytes directly) and
+    the standard library otherwise. Both raise json.JSONDecodeError (orjson's
+    error is a subclass) on invalid input.
+
+    Args:
+        data: JSON document as UTF-8 bytes or a string
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 def retry_with_exponential_backoff(
     func: Callable[..., T],
     max_retries: int = 3,
@@ -52,10 +145,16 @@ def retry_with_exponential_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     retryable_exceptions: tuple = (Exception,),
+    retry_if: Optional[Callable[[Exception], bool]] = None,
+    max_total_wait: Optional[float] = None,
 ) -> Callable[..., T]:
     """
     Retry a function with exponential backoff.
 
+    A delay stated in the error message (see get_retry_delay_from_error) replaces the
+    backoff schedule, and up to 10% random jitter is added to every wait; no wait
+    exceeds max_delay.
+
     Args:
         func: Function to retry
         max_retries: Maximum number of retry attempts
@@ -63,33 +162,56 @@ def retry_with_exponential_backoff(
         max_delay: Maximum delay between retries in seconds
         exponential_base: Base for exponential backoff calculation
         retryable_exceptions: Tuple of exceptions that should trigger a retry
+        retry_if: Optional predicate; a caught exception is only retried if it returns True
+        max_total_wait: Optional budget in seconds from the first attempt; a retry whose
+            backoff delay would end past it is not attempted
 
     Returns:
         Wrapped function with retry logic
     """
 
+    # Backoff schedule and attempt numbers, computed once per wrapped function
+    delays = tuple(
+        min(initial_delay * (exponential_base**i), max_delay) for i in range(max_retries)
+    )
+    attempts = range(max_retries + 1)
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
-        delay = initial_delay
         last_exception = None
+        deadline = None if max_total_wait is None else time.monotonic() + max_total_wait
 
-        for attempt in range(max_retries + 1):
+        for attempt in attempts:
             try:
                 return func(*args, **kwargs)
             except retryable_exceptions as e:
                 last_exception = e
 
+                if retry_if is not None and not retry_if(e):
+                    raise
+
                 if attempt == max_retries:
                     logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}")
                     raise
 
-                # Calculate delay with exponential backoff
-                delay = min(initial_delay * (exponential_base**attempt), max_delay)
+                # Prefer the provider's own hint, add up to 10% jitter so that concurrent
+                # callers don't all retry at the same moment, then cap at max_delay
+                server_delay = get_retry_delay_from_error(e)
+                delay = delays[attempt] if server_delay is None else server_delay
+                delay = min(delay + random.random() * delay * 0.1, max_delay)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    logger.error(f"Retry budget ({max_total_wait}s) exhausted for {func.__name__}")
+                    raise
 
-                logger.warning(
-                    f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
-                    f"Retrying in {delay:.2f}s..."
-                )
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                        attempt + 1,
+                        max_retries + 1,
+                        func.__name__,
+                        e,
+                        delay,
+                    )
 
                 time.sleep(delay)
 
@@ -100,23 +222,99 @@ def retry_with_exponential_backoff(
     return wrapper
 
 
+def async_retry_with_exponential_backoff(
+    func: Callable[..., Awaitable[T]],
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exponential_base: float = 2.0,
+    retryable_exceptions: tuple = (Exception,),
+    retry_if: Optional[Callable[[Exception], bool]] = None,
+    max_total_wait: Optional[float] = None,
+) -> Callable[..., Awaitable[T]]:
+    """
+    Retry a coroutine function with exponential backoff.
+
+    Async counterpart of retry_with_exponential_backoff; waits with asyncio.sleep
+    so the event loop keeps serving other requests between attempts.
+
+    Args:
+        func: Coroutine function to retry
+        max_retries: Maximum number of retry attempts
+        initial_delay: Initial delay between retries in seconds
+        max_delay: Maximum delay between retries in seconds
+        exponential_base: Base for exponential backoff calculation
+        retryable_exceptions: Tuple of exceptions that should trigger a retry
+        retry_if: Optional predicate; a caught exception is only retried if it returns True
+        max_total_wait: Optional budget in seconds from the first attempt; a retry whose
+            backoff delay would end past it is not attempted
+
+    Returns:
+        Wrapped coroutine function with retry logic
+    """
+
+    # Backoff schedule and attempt numbers, computed once per wrapped function
+    delays = tuple(
+        min(initial_delay * (exponential_base**i), max_delay) for i in range(max_retries)
+    )
+    attempts = range(max_retries + 1)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        deadline = None if max_total_wait is None else time.monotonic() + max_total_wait
+
+        for attempt in attempts:
+            try:
+                return await func(*args, **kwargs)
+            except retryable_exceptions as e:
+                if retry_if is not None and not retry_if(e):
+                    raise
+
+                if attempt == max_retries:
+                    logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}")
+                    raise
+
+                # Prefer the provider's own hint, add up to 10% jitter so that concurrent
+                # callers don't all retry at the same moment, then cap at max_delay
+                server_delay = get_retry_delay_from_error(e)
+                delay = delays[attempt] if server_delay is None else server_delay
+                delay = min(delay + random.random() * delay * 0.1, max_delay)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    logger.error(f"Retry budget ({max_total_wait}s) exhausted for {func.__name__}")
+                    raise
+
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                        attempt + 1,
+                        max_retries + 1,
+                        func.__name__,
+                        e,
+                        delay,
+                    )
+
+                await asyncio.sleep(delay)
+
+    return wrapper
+
+
 def is_rate_limit_error(exception: Exception) -> bool:
     """
     Check if an exception is a rate limit error.
 
-    This handles various provider-specific rate limit exceptions.
+    This handles various provider-specific rate limit exceptions. Exceptions
+    carrying a raw bytes body as their only argument are searched without
+    decoding it.
     """
-    error_message = str(exception).lower()
-    rate_limit_indicators = [
-        "rate limit",
-        "rate_limit",
-        "too many requests",
-        "429",
-        "quota exceeded",
-        "resource_exhausted",
-    ]
+    args = exception.args
+    if len(args) == 1 and isinstance(args[0], (bytes, bytearray)):
+        return _is_rate_limit_bytes(args[0])
+    return _RATE_LIMIT_RE.search(str(exception)) is not None
 
-    return any(indicator in error_message for indicator in rate_limit_indicators)
+
+def _is_rate_limit_bytes(body: bytes) -> bool:
+    """Check a raw error body for rate limit indicators."""
+    return _RATE_LIMIT_BYTES_RE.search(body) is not None
 
 
 def get_retry_delay_from_error(exception: Exception) -> Optional[float]:
@@ -125,19 +323,17 @@ def get_retry_delay_from_error(exception: Exception) -> Optional[float]:
 
     Some providers include a retry-after header or message.
     """
-    error_message = str(exception).lower()
-
-    # Try to extract "retry after X seconds" patterns
-    import re
+    match = _RETRY_DELAY_RE.search(str(exception))
+    if match:
+        return float(match.group(1) or match.group(2))
 
-    patterns = [r"retry after (\d+)", r"retry in (\d+)", r"wait (\d+) seconds"]
+    return None
 
-    for pattern in patterns:
-        match = re.search(pattern, error_message)
-        if match:
-            return float(match.group(1))
 
-    return None
+@lru_cache(maxsize=64)
+def _mime_for_ext(ext: str) -> str:
+    """Map a file extension (without the dot, any case) to an image MIME type."""
+    return _MIME_TYPES.get(ext.lower(), "image/jpeg")
 
 
 def detect_image_mime_type(file_path: str) -> str:
@@ -151,28 +347,166 @@ def detect_image_mime_type(file_path: str) -> str:
         MIME type string (e.g., "image/png", "image/jpeg")
         Defaults to "image/jpeg" if extension is not recognized
     """
-    import os
+    _, dot, ext = file_path.rpartition(".")
+    return _mime_for_ext(ext) if dot else "image/jpeg"
+
+
+@lru_cache(maxsize=128)
+def json_schema_for(cls: Any) -> Optional[dict]:
+    """
+    Return the JSON schema of a Pydantic model class (v2 or v1), computed once per class.
+
+    The schema is shared between requests, so callers must not mutate it.
+
+    Args:
+        cls: Pydantic model class
+
+    Returns:
+        The JSON schema dict, or None if ``cls`` is not a Pydantic model
+    """
+    if hasattr(cls, "model_json_schema"):
+        return cls.model_json_schema()
+    if hasattr(cls, "schema"):
+        return cls.schema()
+    return None
+
+
+def sniff_image_mime_type(head: bytes) -> Optional[str]:
+    """
+    Detect the MIME type of an image from its leading magic bytes.
+
+    Args:
+        head: The first bytes of the image (12 are enough)
+
+    Returns:
+        MIME type string for PNG, JPEG, GIF and WebP images, None otherwise
+    """
+    if head.startswith(b"\x89PNG"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"GIF8"):
+        return "image/gif"
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def b64encode_bytes(data: bytes) -> str:
+    """
+    Base64-encode bytes to an ASCII string.
+
+    Uses the SIMD-accelerated pybase64 when it is installed and the standard
+    library otherwise.
+
+    Args:
+        data: Bytes to encode
+
+    Returns:
+        Base64-encoded data as an ASCII string
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def b64encode_file(
+    file_path: Union[str, os.PathLike, BinaryIO],
+    chunk_size: int = B64_CHUNK_SIZE,
+    prefix: str = "",
+) -> str:
+    """
+    Base64-encode a file's contents without holding an extra copy of the raw bytes.
+
+    The file is read in chunks and encoded into a buffer pre-sized from the file
+    size, so only the encoded output is kept in memory. An optional prefix (such
+    as a ``data:`` URI header) is written into the same buffer, so building a
+    data URI does not copy the encoded string again.
+
+    Args:
+        file_path: Path to the file to encode, or a seekable binary file object,
+            which is encoded from its current position to the end
+        chunk_size: Bytes read per iteration (must be a multiple of 3)
+        prefix: ASCII text to place before the encoded data
+
+    Returns:
+        The prefix followed by the base64-encoded file contents
+
+    Raises:
+        ValueError: If chunk_size is not a positive multiple of 3
+    """
+    if chunk_size <= 0 or chunk_size % 3:
+        raise ValueError(f"chunk_size must be a positive multiple of 3, got {chunk_size}")
+
+    if isinstance(file_path, (str, os.PathLike)):
+        with open(file_path, "rb") as f:
+            return _b64encode_stream(f, chunk_size, prefix)
+    return _b64encode_stream(file_path, chunk_size, prefix)
 
-    ext = os.path.splitext(file_path)[1].lower()
 
-    mime_types = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".gif": "image/gif",
-        ".webp": "image/webp",
-        ".bmp": "image/bmp",
-        ".tiff": "image/tiff",
-        ".tif": "image/tiff",
-    }
+def _b64encode_stream(f: BinaryIO, chunk_size: int, prefix: str) -> str:
+    """Base64-encode an open binary file from its current position (see b64encode_file)."""
+    b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
 
-    return mime_types.get(ext, "image/jpeg")
+    start = f.tell()
+    size = f.seek(0, os.SEEK_END) - start
+    f.seek(start)
+
+    header = prefix.encode("ascii")
+    pos = len(header)
+    encoded = bytearray(pos + 4 * ((size + 2) // 3))
+    encoded[:pos] = header
+    # Read into one reusable buffer instead of allocating a bytes object per chunk;
+    # its size stays a multiple of 3 so every full chunk encodes without padding
+    chunk = memoryview(bytearray(min(chunk_size, 3 * ((size + 2) // 3)) or chunk_size))
+    while n := f.readinto(chunk):
+        block = b64encode(chunk[:n])
+        encoded[pos : pos + len(block)] = block
+        pos += len(block)
+
+    # The file may have changed size since it was measured
+    del encoded[pos:]
+    return encoded.decode("ascii")
+
+
+def _read_text_file(filepath: str) -> str:
+    """
+    Read one text file for read_text_files().
+
+    The file is read once as bytes and decoded as UTF-8, falling back to
+    latin-1 for older documents. Read errors are returned as placeholder text
+    so one bad file does not fail the whole prompt.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        logger.error(f"File not found: {filepath}")
+        return f"[File not found: {filepath}]"
+    except Exception as e:
+        logger.error(f"Error reading file {filepath}: {e}")
+        return f"[Error: {e}]"
+
+    try:
+        # Try UTF-8 first (most common)
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fallback to latin-1 for older documents
+        content = raw.decode("latin-1")
+
+    # Match text-mode reads, which translate \r\n and \r to \n
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def read_text_files(file_paths: list[str]) -> str:
     """
     Read text files and format them for inclusion in a prompt.
 
+    More than ``_PARALLEL_READ_THRESHOLD`` files are read concurrently; the
+    output keeps the order of ``file_paths``.
+
     Args:
         file_paths: List of paths to text files
 
@@ -190,15 +524,12 @@ def read_text_files(file_paths: list[str]) -> str:
         >>> # content of doc2...
         >>> # </file>
     """
-    import os
-
     _IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tiff", ".tif"}
 
     if not file_paths:
         return ""
 
-    file_sections = []
-
+    text_files = []
     for filepath in file_paths:
         filename = os.path.basename(filepath)
         ext = os.path.splitext(filename)[1].lower()
@@ -210,26 +541,19 @@ def read_text_files(file_paths: list[str]) -> str:
             )
             continue
 
-        try:
-            # Try UTF-8 first (most common)
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Fallback to latin-1 for older documents
-            try:
-                with open(filepath, "r", encoding="latin-1") as f:
-                    content = f.read()
-            except Exception as e:
-                logger.warning(f"Failed to read file {filepath}: {e}")
-                content = f"[Error reading file: {e}]"
-        except FileNotFoundError:
-            logger.error(f"File not found: {filepath}")
-            content = f"[File not found: {filepath}]"
-        except Exception as e:
-            logger.error(f"Error reading file {filepath}: {e}")
-            content = f"[Error: {e}]"
-
-        file_sections.append(f'<file name="{filename}">\n{content}\n</file>')
+        text_files.append((filepath, filename))
+
+    paths = [filepath for filepath, _ in text_files]
+    if len(paths) > _PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_READ_WORKERS)) as executor:
+            contents = list(executor.map(_read_text_file, paths))
+    else:
+        contents = [_read_text_file(filepath) for filepath in paths]
+
+    file_sections = [
+        f'<file name="{filename}">\n{content}\n</file>'
+        for (_, filename), content in zip(text_files, contents)
+    ]
 
     return "\n\n" + "\n\n".join(file_sections)
 
@@ -264,33 +588,31 @@ def resize_image_if_needed(
     try:
         from PIL import Image
         import tempfile
-        import os
 
-        # Open and check size
-        img = Image.open(image_path)
+        # Open lazily: only the header is read until pixel data is needed
+        with Image.open(image_path) as img:
+            # No resize needed if within bounds
+            if max(img.size) <= max_size:
+                logger.debug(f"Image {image_path} is within size limit ({img.size})")
+                return image_path
 
-        # No resize needed if within bounds
-        if max(img.size) <= max_size:
-            logger.debug(f"Image {image_path} is within size limit ({img.size})")
-            return image_path
+            # Calculate new size maintaining aspect ratio
+            original_size = img.size
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
-        # Calculate new size maintaining aspect ratio
-        original_size = img.size
-        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            # Create temporary file
+            suffix = os.path.splitext(image_path)[1] or ".jpg"
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
 
-        # Create temporary file
-        suffix = os.path.splitext(image_path)[1] or ".jpg"
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+            # Save resized image
+            # Convert RGBA to RGB for JPEG
+            if img.mode in ("RGBA", "LA", "P"):
+                rgb_img = Image.new("RGB", img.size, (255, 255, 255))
+                rgb_img.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
+                img = rgb_img
 
-        # Save resized image
-        # Convert RGBA to RGB for JPEG
-        if img.mode in ("RGBA", "LA", "P"):
-            rgb_img = Image.new("RGB", img.size, (255, 255, 255))
-            rgb_img.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
-            img = rgb_img
-
-        img.save(temp_file.name, "JPEG", quality=quality, optimize=True)
-        temp_file.close()
+            img.save(temp_file.name, "JPEG", quality=quality, optimize=True, progressive=True)
+            temp_file.close()
 
         logger.info(
             f"Resized image {os.path.basename(image_path)} from {original_size} to {img.size}"
@@ -329,24 +651,23 @@ def extract_json_from_text(text: str) -> Optional[dict | list]:
         >>> extract_json_from_text(text)
         {'key': 'value'}
     """
-    import json
-    import re
-
     if not text or not isinstance(text, str):
         return None
 
     content = text.strip()
 
     try:
-        # Try to extract JSON from code blocks
-        if "```json" in content:
-            # Match ```json ... ```
-            json_match = re.search(r"```json\s*([\s\S]*?)\s*```", content)
-            if json_match:
-                content = json_match.group(1).strip()
-        elif "```" in content:
-            # Match generic code blocks ``` ... ```
-            json_match = re.search(r"```\s*([\s\S]*?)\s*```", content)
+        # Try to extract JSON from code blocks; a ```json fence takes precedence
+        # over generic ones, and regex searches start at the fence found
+        fence = content.find("```")
+        if fence != -1:
+            json_fence = content.find("```json", fence)
+            if json_fence != -1:
+                # Match ```json ... ```
+                json_match = _JSON_FENCE_RE.search(content, json_fence)
+            else:
+                # Match generic code blocks ``` ... ```
+                json_match = _CODE_FENCE_RE.search(content, fence)
             if json_match:
                 content = json_match.group(1).strip()
 
@@ -7,18 +7,18 @@ from pydantic import BaseModel
 from ai_client import create_ai_client, set_pricing_file
 from decouple import config
 
-# Enable debug logging
-logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
 
+if __name__ == "__main__":
+    # Enable debug logging
+    logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
 
-# Create a client for any provider
-client = create_ai_client('openai', api_key="secret-key",
-                          base_url="http://localhost:8000/v1")
+    # Create a client for any provider
+    client = create_ai_client('openai', api_key="secret-key",
+                              base_url="http://localhost:8000/v1")
 
+    response1 = client.prompt(
+        'command-a-03-2025',
+        "Tell me a joke.",
+    )
 
-response1 = client.prompt(
-    'command-a-03-2025',
-    "Tell me a joke.",
-)
-
-print(response1.text)
+    print(response1.text)
@@ -2,124 +2,225 @@
 Shared test fixtures and configuration for pytest.
 """
 
+import io
+from dataclasses import dataclass
+from typing import Optional
+
 import pytest
-from unittest.mock import Mock
+from PIL import Image, ImageDraw
+from pydantic import BaseModel
 
+from ai_client import ClaudeClient
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients():
+    """Drop pooled provider clients so each test sees its own patched SDK classes."""
+    ClaudeClient.close_pool()
+    yield
+    ClaudeClient.close_pool()
+
+
+# Provider response stubs: immutable, so a single instance is shared by the whole session
+
+
+@dataclass(frozen=True)
+class OpenAIPromptTokensDetailsStub:
+    cached_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class OpenAIUsageStub:
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    prompt_tokens_details: Optional[OpenAIPromptTokensDetailsStub] = None
+
+
+@dataclass(frozen=True)
+class OpenAIMessageStub:
+    content: str
+    tool_calls: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class OpenAIChoiceStub:
+    message: OpenAIMessageStub
+    finish_reason: str
+
+
+@dataclass(frozen=True)
+class OpenAIRespStub:
+    """Chat completion response shape shared by OpenAI-compatible APIs and Mistral."""
+
+    id: str
+    model: str
+    choices: tuple
+    usage: OpenAIUsageStub
+
+
+@dataclass(frozen=True)
+class ClaudeContentBlockStub:
+    type: str
+    text: str
+
+
+@dataclass(frozen=True)
+class ClaudeUsageStub:
+    input_tokens: int
+    output_tokens: int
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class ClaudeRespStub:
+    id: str
+    model: str
+    content: tuple
+    stop_reason: str
+    usage: ClaudeUsageStub
+
+
+@dataclass(frozen=True)
+class GeminiUsageMetadataStub:
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+
+
+@dataclass(frozen=True)
+class GeminiCandidateStub:
+    finish_reason: str
+
+
+@dataclass(frozen=True)
+class GeminiRespStub:
+    text: str
+    usage_metadata: GeminiUsageMetadataStub
+    candidates: tuple
+
+
+@dataclass(frozen=True)
+class CohereTokensStub:
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass(frozen=True)
+class CohereUsageStub:
+    tokens: CohereTokensStub
+    billed_units: CohereTokensStub
+
+
+@dataclass(frozen=True)
+class CohereTextBlockStub:
+    text: str
+
+
+@dataclass(frozen=True)
+class CohereMessageStub:
+    content: tuple
+
+
+@dataclass(frozen=True)
+class CohereRespStub:
+    id: str
+    finish_reason: str
+    message: CohereMessageStub
+    usage: CohereUsageStub
+
+
+@pytest.fixture(scope="session")
 def mock_openai_response():
-    """Mock OpenAI API response."""
-    response = Mock()
-    response.id = "chatcmpl-123"
-    response.model = "gpt-4"
-    response.choices = [Mock()]
-    response.choices[0].message = Mock()
-    response.choices[0].message.content = "Hello! I'm an AI assistant."
-    response.choices[0].message.tool_calls = (
-        None  # Explicitly set to None to prevent iteration errors
+    """Stub OpenAI API response."""
+    return OpenAIRespStub(
+        id="chatcmpl-123",
+        model="gpt-4",
+        choices=(
+            OpenAIChoiceStub(
+                message=OpenAIMessageStub(content="Hello! I'm an AI assistant."),
+                finish_reason="stop",
+            ),
+        ),
+        usage=OpenAIUsageStub(
+            prompt_tokens=10,
+            completion_tokens=20,
+            total_tokens=30,
+            prompt_tokens_details=OpenAIPromptTokensDetailsStub(cached_tokens=0),
+        ),
     )
-    response.choices[0].finish_reason = "stop"
-    response.usage = Mock()
-    response.usage.prompt_tokens = 10
-    response.usage.completion_tokens = 20
-    response.usage.total_tokens = 30
-    # Mock prompt_tokens_details for cached tokens (prevents Mock comparison errors)
-    response.usage.prompt_tokens_details = Mock()
-    response.usage.prompt_tokens_details.cached_tokens = 0
-    return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_claude_response():
-    """Mock Anthropic Claude API response."""
-    response = Mock()
-    response.id = "msg_123"
-    response.model = "claude-3-5-sonnet-20241022"
-    response.content = [Mock()]
-    response.content[0].type = "text"
-    response.content[0].text = "Hello! I'm Claude."
-    response.stop_reason = "end_turn"
-    response.usage = Mock()
-    response.usage.input_tokens = 15
-    response.usage.output_tokens = 25
-    # Mock cache attributes (prevents Mock comparison errors)
-    response.usage.cache_creation_input_tokens = 0
-    response.usage.cache_read_input_tokens = 0
-    return response
+    """Stub Anthropic Claude API response."""
+    return ClaudeRespStub(
+        id="msg_123",
+        model="claude-3-5-sonnet-20241022",
+        content=(ClaudeContentBlockStub(type="text", text="Hello! I'm Claude."),),
+        stop_reason="end_turn",
+        usage=ClaudeUsageStub(input_tokens=15, output_tokens=25),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gemini_response():
-    """Mock Google Gemini API response."""
-    response = Mock()
-    response.text = "Hello! I'm Gemini."
-    response.usage_metadata = Mock()
-    response.usage_metadata.prompt_token_count = 12
-    response.usage_metadata.candidates_token_count = 18
-    response.usage_metadata.total_token_count = 30
-    response.candidates = [Mock()]
-    response.candidates[0].finish_reason = "STOP"
-    return response
+    """Stub Google Gemini API response."""
+    return GeminiRespStub(
+        text="Hello! I'm Gemini.",
+        usage_metadata=GeminiUsageMetadataStub(
+            prompt_token_count=12, candidates_token_count=18, total_token_count=30
+        ),
+        candidates=(GeminiCandidateStub(finish_reason="STOP"),),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mistral_response():
-    """Mock Mistral API response."""
-    response = Mock()
-    response.id = "cmpl_123"
-    response.model = "mistral-large-latest"
-    response.choices = [Mock()]
-    response.choices[0].message = Mock()
-    response.choices[0].message.content = "Hello! I'm Mistral."
-    response.choices[0].finish_reason = "stop"
-    response.usage = Mock()
-    response.usage.prompt_tokens = 11
-    response.usage.completion_tokens = 19
-    response.usage.total_tokens = 30
-    return response
+    """Stub Mistral API response."""
+    return OpenAIRespStub(
+        id="cmpl_123",
+        model="mistral-large-latest",
+        choices=(
+            OpenAIChoiceStub(
+                message=OpenAIMessageStub(content="Hello! I'm Mistral."), finish_reason="stop"
+            ),
+        ),
+        usage=OpenAIUsageStub(prompt_tokens=11, completion_tokens=19, total_tokens=30),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_cohere_response():
-    """Mock Cohere API response."""
-    response = Mock()
-    response.id = "cohere_123"
-    response.finish_reason = "COMPLETE"
-
-    # Mock message content structure
-    message = Mock()
-    content_block = Mock()
-    content_block.text = "Hello! I'm Cohere."
-    message.content = [content_block]
-    response.message = message
-
-    # Mock usage information
-    usage = Mock()
-    tokens = Mock()
-    tokens.input_tokens = 13
-    tokens.output_tokens = 17
-    usage.tokens = tokens
-
-    billed_units = Mock()
-    billed_units.input_tokens = 13
-    billed_units.output_tokens = 17
-    usage.billed_units = billed_units
-
-    response.usage = usage
-    return response
-
+    """Stub Cohere API response."""
+    tokens = CohereTokensStub(input_tokens=13, output_tokens=17)
+    return CohereRespStub(
+        id="cohere_123",
+        finish_reason="COMPLETE",
+        message=CohereMessageStub(content=(CohereTextBlockStub(text="Hello! I'm Cohere."),)),
+        usage=CohereUsageStub(tokens=tokens, billed_units=tokens),
+    )
 
-@pytest.fixture
-def sample_image_path(tmp_path):
-    """Create a temporary test image file using Pillow."""
-    from PIL import Image, ImageDraw
 
+@pytest.fixture(scope="session")
+def sample_png_bytes():
+    """Encode the sample test image once per session."""
     # Create a simple 100x100 image with a red square on white background
-    image_file = tmp_path / "test_image.png"
     img = Image.new("RGB", (100, 100), color="white")
     draw = ImageDraw.Draw(img)
     draw.rectangle([25, 25, 75, 75], fill="red")
-    img.save(str(image_file), "PNG")
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def sample_image_path(tmp_path, sample_png_bytes):
+    """Write the sample test image to a temporary PNG file."""
+    image_file = tmp_path / "test_image.png"
+    image_file.write_bytes(sample_png_bytes)
 
     return str(image_file)
 
@@ -133,7 +234,6 @@ def mock_api_key():
 @pytest.fixture
 def mock_pydantic_model():
     """Create a sample Pydantic model for testing structured output."""
-    from pydantic import BaseModel
 
     class TestModel(BaseModel):
         name: str
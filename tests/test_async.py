@@ -4,7 +4,7 @@ Tests for async functionality.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from ai_client import create_ai_client
 from ai_client.response import LLMResponse
 
@@ -15,10 +15,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_basic(self, mock_openai_response):
         """Test basic async prompt."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             client = create_ai_client("openai", api_key="test-key")
             response = await client.prompt_async("gpt-4", "Hello!")
@@ -30,10 +33,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_parallel(self, mock_openai_response):
         """Test parallel async prompts."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             client = create_ai_client("openai", api_key="test-key")
 
@@ -52,10 +58,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_with_images(self, mock_openai_response, sample_image_path):
         """Test async prompt with images."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             client = create_ai_client("openai", api_key="test-key")
             response = await client.prompt_async(
@@ -67,10 +76,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_with_custom_params(self, mock_openai_response):
         """Test async prompt with custom parameters."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             client = create_ai_client("openai", api_key="test-key")
             response = await client.prompt_async("gpt-4", "Hello", temperature=0.9, max_tokens=100)
@@ -85,10 +97,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_error_handling(self):
         """Test async prompt error handling."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
 
             client = create_ai_client("openai", api_key="test-key")
             response = await client.prompt_async("gpt-4", "Hello")
@@ -100,10 +115,13 @@ class TestAsyncFunctionality:
     @pytest.mark.asyncio
     async def test_prompt_async_benchmark_simulation(self, mock_openai_response, sample_image_path):
         """Simulate a benchmark workflow with async processing."""
-        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
             mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_openai_response
+            mock_async_class.return_value = mock_client
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             client = create_ai_client("openai", api_key="test-key")
 
@@ -126,3 +144,180 @@ class TestAsyncFunctionality:
             assert len(results) == 10
             for response in results:
                 assert isinstance(response, LLMResponse)
+
+    @pytest.mark.asyncio
+    async def test_claude_prompt_async_uses_async_client(self, mock_claude_response):
+        """Test that Claude's prompt_async awaits AsyncAnthropic instead of a thread."""
+        with (
+            patch("ai_client.claude_client.Anthropic") as mock_anthropic_class,
+            patch("ai_client.claude_client.AsyncAnthropic") as mock_async_class,
+        ):
+            mock_async_client = Mock()
+            mock_async_client.messages.create = AsyncMock(return_value=mock_claude_response)
+            mock_async_class.return_value = mock_async_client
+
+            client = create_ai_client("anthropic", api_key="test-key")
+            response = await client.prompt_async("claude-3-5-sonnet-20241022", "Hello!")
+
+            assert isinstance(response, LLMResponse)
+            assert response.text == "Hello! I'm Claude."
+            assert response.conversation_id is not None
+            mock_async_client.messages.create.assert_awaited_once()
+            mock_anthropic_class.return_value.messages.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claude_aend_client_closes_async_client(self, mock_claude_response):
+        """Test that aend_client() closes the AsyncAnthropic client it created."""
+        with (
+            patch("ai_client.claude_client.Anthropic"),
+            patch("ai_client.claude_client.AsyncAnthropic") as mock_async_class,
+        ):
+            mock_async_client = Mock()
+            mock_async_client.messages.create = AsyncMock(return_value=mock_claude_response)
+            mock_async_client.close = AsyncMock()
+            mock_async_class.return_value = mock_async_client
+
+            client = create_ai_client("anthropic", api_key="test-key")
+            await client.prompt_async("claude-3-5-sonnet-20241022", "Hello!")
+            await client.aend_client()
+
+            mock_async_client.close.assert_awaited_once()
+            assert client.async_api_client is None
+            assert client.end_time is not None
+
+    @pytest.mark.asyncio
+    async def test_prompt_async_respects_max_concurrent_requests(self, mock_claude_response):
+        """Test that max_concurrent_requests caps in-flight async requests."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_claude_response
+
+        with (
+            patch("ai_client.claude_client.Anthropic"),
+            patch("ai_client.claude_client.AsyncAnthropic") as mock_async_class,
+        ):
+            mock_async_class.return_value.messages.create = slow_create
+
+            client = create_ai_client("anthropic", api_key="test-key", max_concurrent_requests=2)
+            results = await asyncio.gather(
+                *[
+                    client.prompt_async("claude-3-5-sonnet-20241022", f"Prompt {i}")
+                    for i in range(6)
+                ]
+            )
+
+            assert all(r.text == "Hello! I'm Claude." for r in results)
+            assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_openai_prompt_async_uses_async_client(self, mock_openai_response):
+        """Test that OpenAI's prompt_async awaits AsyncOpenAI instead of a thread."""
+        with (
+            patch("ai_client.openai_client.OpenAI") as mock_openai_class,
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
+            mock_async_client = Mock()
+            mock_async_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+            mock_async_class.return_value = mock_async_client
+
+            client = create_ai_client("openai", api_key="test-key")
+            response = await client.prompt_async("gpt-4", "Hello!")
+
+            assert response.text == "Hello! I'm an AI assistant."
+            mock_async_client.chat.completions.create.assert_awaited_once()
+            mock_openai_class.return_value.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_openai_prompt_async_json_mode_fallback(
+        self, mock_openai_response, mock_pydantic_model
+    ):
+        """Test that a failed async structured-output parse falls back to JSON mode."""
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
+            mock_async_client = Mock()
+            mock_async_client.beta.chat.completions.parse = AsyncMock(
+                side_effect=Exception("parse failed")
+            )
+            mock_async_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+            mock_async_class.return_value = mock_async_client
+
+            client = create_ai_client("openai", api_key="test-key")
+            await client.prompt_async("gpt-4", "Extract data", response_format=mock_pydantic_model)
+
+            call = mock_async_client.chat.completions.create.call_args
+            assert call.kwargs["response_format"] == {"type": "json_object"}
+            assert '"value"' in call.kwargs["messages"][-1]["content"][-1]["text"]
+
+
+class TestPromptMany:
+    """Tests for prompt_many."""
+
+    def test_prompt_many_preserves_order_and_limits_concurrency(self):
+        """Test that responses follow the prompt order with a bounded number in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            prompt = kwargs["messages"][-1]["content"][0]["text"]
+            # Later prompts finish first
+            await asyncio.sleep(0.01 * (10 - int(prompt.split()[-1])))
+            in_flight -= 1
+
+            response = Mock()
+            response.model = "gpt-4"
+            response.choices = [Mock()]
+            response.choices[0].message.content = f"Answer to {prompt}"
+            response.choices[0].message.tool_calls = None
+            response.choices[0].finish_reason = "stop"
+            response.usage.prompt_tokens = 1
+            response.usage.completion_tokens = 1
+            response.usage.total_tokens = 2
+            response.usage.prompt_tokens_details.cached_tokens = 0
+            return response
+
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
+            mock_async_class.return_value.chat.completions.create = slow_create
+
+            client = create_ai_client("openai", api_key="test-key")
+            prompts = [f"Prompt {i}" for i in range(8)]
+            responses = client.prompt_many("gpt-4", prompts, concurrency=3)
+
+            assert [r.text for r in responses] == [f"Answer to {p}" for p in prompts]
+            assert peak == 3
+
+    def test_prompt_many_can_run_repeatedly(self, mock_openai_response):
+        """Test that each call gets, and closes, an async client bound to its own event loop."""
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("ai_client.openai_client.AsyncOpenAI") as mock_async_class,
+        ):
+            mock_async_class.return_value.chat.completions.create = AsyncMock(
+                return_value=mock_openai_response
+            )
+
+            mock_async_class.return_value.close = AsyncMock()
+
+            client = create_ai_client("openai", api_key="test-key")
+            for _ in range(3):
+                responses = client.prompt_many("gpt-4", ["Hello!"])
+                assert responses[0].text == "Hello! I'm an AI assistant."
+
+            # One async client per batch, each closed before its loop ended
+            assert mock_async_class.call_count == 3
+            assert mock_async_class.return_value.close.await_count == 3
+            assert client.async_api_client is None
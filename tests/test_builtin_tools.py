@@ -0,0 +1,122 @@
+"""
+Tests for the built-in tools.
+"""
+
+import pytest
+import requests
+
+from ai_client.tools.builtin import geonames, wikidata
+from ai_client.tools.builtin.geonames import search_geonames
+
+
+@pytest.fixture(autouse=True)
+def _clear_tool_caches():
+    """Start every test with empty tool result caches."""
+    search_geonames.cache_clear()
+    wikidata.search_wikidata.cache_clear()
+
+
+class TestSearchGeonames:
+    """Tests for search_geonames."""
+
+    @pytest.fixture(autouse=True)
+    def _require_geonamescache(self):
+        pytest.importorskip("geonamescache")
+
+    def test_accent_insensitive_exact_match(self):
+        """Test that an unaccented query finds the accented city first."""
+        results = search_geonames("Zurich, Switzerland", max_results=3)["results"]
+
+        assert results[0]["name"] == "Zürich"
+        assert results[0]["country"] == "CH"
+        assert "match_score" not in results[0]
+
+    def test_results_sorted_and_limited(self):
+        """Test that results are limited and ordered by score then population."""
+        response = search_geonames("Paris", max_results=5)
+        results = response["results"]
+
+        assert response["result_count"] == len(results) == 5
+        assert results[0]["name"] == "Paris"
+        assert results[0]["country"] == "FR"
+
+    def test_dataset_loaded_once(self, monkeypatch, mocker):
+        """Test that the city dataset is loaded once and reused across searches."""
+        import geonamescache
+
+        monkeypatch.setattr(geonames, "_city_index", None)
+        load = mocker.spy(geonamescache, "GeonamesCache")
+
+        search_geonames("Bern")
+        search_geonames("Basel")
+
+        assert load.call_count == 1
+
+    def test_index_build_leaves_query_cache_alone(self, monkeypatch):
+        """Test that normalizing city names for the index does not fill the query cache."""
+        monkeypatch.setattr(geonames, "_city_index", None)
+        geonames.normalize_text.cache_clear()
+
+        search_geonames("Zürich")
+
+        assert geonames.normalize_text.cache_info().currsize <= 2
+
+    def test_missing_geonamescache(self, monkeypatch):
+        """Test that a missing geonamescache package is reported in the result."""
+        monkeypatch.setattr(geonames, "geonamescache", None)
+
+        result = search_geonames("Bern")
+
+        assert "geonamescache not installed" in result["error"]
+        assert result["results"] == []
+
+    def test_no_match(self):
+        """Test that an unknown name returns an empty list."""
+        response = search_geonames("xqzvwplk")
+
+        assert response["result_count"] == 0
+        assert response["results"] == []
+
+
+class TestSearchWikidata:
+    """Tests for search_wikidata."""
+
+    def test_uses_shared_session(self, mocker):
+        """Test that lookups go through the pooled module-level session."""
+        get = mocker.patch.object(wikidata._http_session, "get")
+        get.return_value.json.return_value = {
+            "search": [{"id": "Q90", "label": "Paris", "concepturi": "http://wd/Q90"}]
+        }
+
+        result = wikidata.search_wikidata("Paris", max_results=1)
+
+        assert result["results"] == [
+            {"wikidata_id": "Q90", "label": "Paris", "description": "", "url": "http://wd/Q90"}
+        ]
+        assert get.call_args.kwargs["params"]["search"] == "Paris"
+        assert "ai_client" in wikidata._http_session.headers["User-Agent"]
+
+    def test_results_are_cached(self, mocker):
+        """Test that a repeated lookup is served from the cache."""
+        get = mocker.patch.object(wikidata._http_session, "get")
+        get.return_value.json.return_value = {"search": [{"id": "Q90", "label": "Paris"}]}
+
+        first = wikidata.search_wikidata("Paris")
+        first["results"].clear()
+        second = wikidata.search_wikidata("Paris")
+
+        assert get.call_count == 1
+        assert second["results"][0]["wikidata_id"] == "Q90"
+
+    def test_request_error(self, mocker):
+        """Test that HTTP failures are reported in the result."""
+        mocker.patch.object(
+            wikidata._http_session, "get", side_effect=requests.ConnectionError("offline")
+        )
+
+        result = wikidata.search_wikidata("Paris")
+        wikidata.search_wikidata("Paris")
+
+        assert result["result_count"] == 0
+        assert "offline" in result["error"]
+        assert wikidata._http_session.get.call_count == 2
@@ -4,6 +4,9 @@ Tests for prompt caching functionality across providers.
 This test suite validates the caching implementation for OpenAI, Claude, and Gemini.
 """
 
+import threading
+from unittest.mock import AsyncMock
+
 import pytest
 from ai_client import create_ai_client
 from ai_client.response import Usage, LLMResponse
@@ -399,5 +402,103 @@ class TestClaudeCaching:
         assert response.usage.get_cache_savings() > 0  # Some savings from cache
 
 
+class TestResponseCache:
+    """Test the optional response cache in front of provider calls."""
+
+    @pytest.fixture
+    def cached_client(self, mocker, mock_openai_response):
+        """Create an OpenAI client with a mocked API and an in-memory response cache."""
+        from ai_client import InMemoryResponseCache
+
+        mock_openai = mocker.patch("ai_client.openai_client.OpenAI")
+        mock_openai.return_value.chat.completions.create.return_value = mock_openai_response
+        return create_ai_client(
+            "openai", api_key="test_key", response_cache=InMemoryResponseCache()
+        )
+
+    def test_identical_requests_hit_cache(self, cached_client):
+        """Test that an identical request is answered without calling the API."""
+        create = cached_client.api_client.chat.completions.create
+
+        first = cached_client.prompt("gpt-4", "Hello", temperature=0)
+        second = cached_client.prompt("gpt-4", "Hello", temperature=0)
+
+        assert create.call_count == 1
+        assert second.text == first.text
+        assert second is not first
+        assert second.conversation_id != first.conversation_id
+
+        cached_client.prompt("gpt-4", "Hello again", temperature=0)
+        assert create.call_count == 2
+
+    def test_cached_responses_do_not_share_mutable_state(self, cached_client):
+        """Test that changing a returned response does not change later cache hits."""
+        first = cached_client.prompt("gpt-4", "Hello", temperature=0)
+        first.usage.input_tokens = 999
+
+        second = cached_client.prompt("gpt-4", "Hello", temperature=0)
+        second.usage.output_tokens = 999
+
+        third = cached_client.prompt("gpt-4", "Hello", temperature=0)
+        assert third.usage.input_tokens == 10
+        assert third.usage.output_tokens == 20
+        assert second.usage is not third.usage
+
+    @pytest.mark.asyncio
+    async def test_async_cache_key_built_off_event_loop(self, cached_client, mocker):
+        """Test that prompt_async computes the cache key in a worker thread."""
+        cached_client._do_prompt_async = AsyncMock(
+            return_value=cached_client.prompt("gpt-4", "Warm-up", temperature=0)
+        )
+        key_threads = []
+        build_key = cached_client._response_cache_key
+
+        def record_thread(call_kwargs):
+            key_threads.append(threading.current_thread())
+            return build_key(call_kwargs)
+
+        mocker.patch.object(cached_client, "_response_cache_key", side_effect=record_thread)
+
+        await cached_client.prompt_async("gpt-4", "Hello", temperature=0)
+
+        assert key_threads and threading.main_thread() not in key_threads
+
+    def test_high_temperature_bypasses_cache(self, cached_client):
+        """Test that sampled (high temperature) requests are never cached."""
+        create = cached_client.api_client.chat.completions.create
+
+        cached_client.prompt("gpt-4", "Hello", temperature=0.9)
+        cached_client.prompt("gpt-4", "Hello", temperature=0.9)
+
+        assert create.call_count == 2
+        assert len(cached_client.response_cache) == 0
+
+    def test_default_temperature_bypasses_cache(self, cached_client):
+        """Test that requests without a temperature (provider default sampling) are not cached."""
+        create = cached_client.api_client.chat.completions.create
+
+        cached_client.prompt("gpt-4", "Hello")
+        cached_client.prompt("gpt-4", "Hello")
+
+        assert create.call_count == 2
+        assert len(cached_client.response_cache) == 0
+
+    def test_response_format_schema_computed_once(self, cached_client, mocker):
+        """Test that the cache key reuses the per-class JSON schema."""
+        from pydantic import BaseModel
+
+        class Answer(BaseModel):
+            text: str
+
+        schema = mocker.spy(Answer, "model_json_schema")
+
+        for prompt in ("One", "Two", "Three"):
+            cached_client._response_cache_key(
+                {"model": "gpt-4", "prompt": prompt, "response_format": Answer, "temperature": 0}
+            )
+
+        assert schema.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
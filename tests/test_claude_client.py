@@ -21,6 +21,34 @@ class TestClaudeClient:
             assert client.SUPPORTS_MULTIMODAL is True
             mock_anthropic.assert_called_once()
 
+    def test_clients_share_anthropic_instance(self):
+        """Test that clients with the same credentials reuse one Anthropic client."""
+        with patch("ai_client.claude_client.Anthropic") as mock_anthropic:
+            mock_anthropic.side_effect = lambda **kwargs: Mock()
+            first = create_ai_client("anthropic", api_key="test-key")
+            second = create_ai_client("anthropic", api_key="test-key")
+            other = create_ai_client("anthropic", api_key="other-key")
+
+            assert first.api_client is second.api_client
+            assert other.api_client is not first.api_client
+            assert mock_anthropic.call_count == 2
+            assert mock_anthropic.call_args.kwargs["max_retries"] == 0
+
+    def test_http2_client_when_h2_available(self):
+        """Test that an HTTP/2 httpx client is passed only when h2 is installed and enabled."""
+        with (
+            patch("ai_client.claude_client.Anthropic") as mock_anthropic,
+            patch("ai_client.claude_client.DefaultHttpxClient") as mock_http_client,
+            patch("ai_client.claude_client._HTTP2_AVAILABLE", True),
+        ):
+            create_ai_client("anthropic", api_key="test-key")
+            assert mock_http_client.call_args.kwargs["http2"] is True
+            assert mock_anthropic.call_args.kwargs["http_client"] is mock_http_client.return_value
+
+            create_ai_client("anthropic", api_key="other-key", http2=False)
+            assert "http_client" not in mock_anthropic.call_args.kwargs
+            assert mock_http_client.call_count == 1
+
     def test_prompt_text_only(self, mock_claude_response):
         """Test text-only prompt."""
         with patch("ai_client.claude_client.Anthropic") as mock_anthropic_class:
@@ -110,6 +138,66 @@ class TestClaudeClient:
             assert response.parsed["name"] == "test"
             assert response.parsed["value"] == 42
 
+    def test_raw_response_uses_last_text_block(self):
+        """Test that the last text block becomes the text and tool_use blocks become tool calls."""
+        raw_response = Mock(stop_reason="tool_use", usage=None)
+        raw_response.content = [
+            Mock(type="thinking"),
+            Mock(type="text", text="First"),
+            Mock(type="tool_use", id="call_1", input={"q": "x"}),
+            Mock(type="text", text="Second"),
+        ]
+        raw_response.content[2].name = "search"
+
+        with patch("ai_client.claude_client.Anthropic"):
+            client = create_ai_client("anthropic", api_key="test-key")
+            response = client._create_response_from_raw(raw_response, "claude-3-5-sonnet")
+
+        assert response.text == "Second"
+        assert response.tool_calls == [{"id": "call_1", "name": "search", "arguments": {"q": "x"}}]
+
+    def test_tool_response_without_tool_call_uses_last_text_block(self, mock_pydantic_model):
+        """Test that structured output falls back to the last text block without a tool call."""
+        raw_response = Mock(stop_reason="end_turn", usage=None)
+        raw_response.content = [
+            Mock(type="text", text="Let me think."),
+            Mock(type="text", text='{"name": "test", "value": 42}'),
+        ]
+
+        with patch("ai_client.claude_client.Anthropic"):
+            client = create_ai_client("anthropic", api_key="test-key")
+            response = client._create_response_from_tool(
+                raw_response, "claude-3-5-sonnet", mock_pydantic_model
+            )
+
+        assert response.parsed == {"name": "test", "value": 42}
+
+    def test_structured_output_schema_is_cached(self, mock_claude_response, mock_pydantic_model):
+        """Test that the structured-output tools and tool_choice are built once per response_format."""
+        with (
+            patch("ai_client.claude_client.Anthropic") as mock_anthropic_class,
+            patch.object(
+                mock_pydantic_model,
+                "model_json_schema",
+                wraps=mock_pydantic_model.model_json_schema,
+            ) as schema_spy,
+        ):
+            mock_client = Mock()
+            mock_anthropic_class.return_value = mock_client
+            mock_client.messages.create.return_value = mock_claude_response
+
+            client = create_ai_client("anthropic", api_key="test-key")
+            client.prompt("claude-3-5-sonnet-20241022", "One", response_format=mock_pydantic_model)
+            first_call = mock_client.messages.create.call_args.kwargs
+            client.prompt("claude-3-5-sonnet-20241022", "Two", response_format=mock_pydantic_model)
+            second_call = mock_client.messages.create.call_args.kwargs
+
+            assert schema_spy.call_count == 1
+            assert first_call["tools"] is second_call["tools"]
+            assert first_call["tool_choice"] is second_call["tool_choice"]
+            first_tools = first_call["tools"]
+            assert first_tools[0]["input_schema"]["properties"].keys() == {"name", "value"}
+
     def test_max_tokens_varies_by_model(self):
         """Test that max_tokens defaults vary by model."""
         with patch("ai_client.claude_client.Anthropic") as mock_anthropic_class:
@@ -136,3 +224,101 @@ class TestClaudeClient:
             client.prompt("claude-3-5-sonnet-20241022", "test")
             call_args = mock_client.messages.create.call_args
             assert call_args.kwargs["max_tokens"] == 8192
+
+    def test_prompt_with_multiple_images_preserves_order(self, mock_claude_response, tmp_path):
+        """Test that concurrently loaded images keep their original order."""
+        from PIL import Image
+
+        png_path = tmp_path / "first.png"
+        jpg_path = tmp_path / "second.jpg"
+        Image.new("RGB", (10, 10), color="red").save(str(png_path), "PNG")
+        Image.new("RGB", (10, 10), color="blue").save(str(jpg_path), "JPEG")
+
+        with patch("ai_client.claude_client.Anthropic") as mock_anthropic_class:
+            mock_client = Mock()
+            mock_anthropic_class.return_value = mock_client
+            mock_client.messages.create.return_value = mock_claude_response
+
+            client = create_ai_client("anthropic", api_key="test-key")
+            client.prompt(
+                "claude-3-5-sonnet-20241022",
+                "Compare these images",
+                images=[str(png_path), str(tmp_path / "missing.png"), str(jpg_path)],
+            )
+
+            content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+            image_blocks = [item for item in content if item["type"] == "image"]
+            assert [block["source"]["media_type"] for block in image_blocks] == [
+                "image/png",
+                "image/jpeg",
+            ]
+
+    def test_url_images_use_url_source(self, mock_claude_response):
+        """Test that URL images are passed through unless prefer_url_images is disabled."""
+        url = "https://example.com/image.png"
+
+        with (
+            patch("ai_client.claude_client.Anthropic") as mock_anthropic_class,
+            patch("ai_client.claude_client._http_session") as mock_session,
+        ):
+            mock_client = Mock()
+            mock_anthropic_class.return_value = mock_client
+            mock_client.messages.create.return_value = mock_claude_response
+            mock_session.get.return_value = Mock(status_code=200, content=b"image-bytes")
+
+            client = create_ai_client("anthropic", api_key="test-key")
+            client.prompt("claude-3-5-sonnet-20241022", "Describe", images=[url])
+
+            content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+            image_block = next(item for item in content if item["type"] == "image")
+            assert image_block["source"] == {"type": "url", "url": url}
+            mock_session.get.assert_not_called()
+
+            client = create_ai_client("anthropic", api_key="test-key", prefer_url_images=False)
+            client.prompt("claude-3-5-sonnet-20241022", "Describe", images=[url])
+
+            content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+            image_block = next(item for item in content if item["type"] == "image")
+            assert image_block["source"]["type"] == "base64"
+            mock_session.get.assert_called_once()
+
+    def test_get_model_list_formats_created_at(self):
+        """Test that model creation dates are formatted from their native types."""
+        from datetime import datetime, timezone
+
+        with patch("ai_client.claude_client.Anthropic") as mock_anthropic_class:
+            mock_client = Mock()
+            mock_anthropic_class.return_value = mock_client
+            mock_client.models.list.return_value = [
+                Mock(id="claude-a", created_at=datetime(2025, 2, 24, 12, 0, tzinfo=timezone.utc)),
+                Mock(id="claude-b", created_at=1709164800),
+                Mock(id="claude-c", created_at="2024-10-22T00:00:00Z"),
+                Mock(id="claude-d", created_at=None),
+            ]
+
+            client = create_ai_client("anthropic", api_key="test-key")
+
+            assert client.get_model_list() == [
+                ("claude-a", "2025-02-24"),
+                ("claude-b", "2024-02-29"),
+                ("claude-c", "2024-10-22"),
+                ("claude-d", None),
+            ]
+
+    def test_non_transient_errors_are_not_retried(self):
+        """Test that client errors fail immediately while server errors are retried."""
+        import anthropic
+        import httpx
+
+        def status_error(cls, status_code):
+            request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            response = httpx.Response(status_code, request=request)
+            return cls("error", response=response, body=None)
+
+        with patch("ai_client.claude_client.Anthropic"):
+            client = create_ai_client("anthropic", api_key="test-key")
+
+        assert not client._is_retryable_error(status_error(anthropic.AuthenticationError, 401))
+        assert not client._is_retryable_error(status_error(anthropic.NotFoundError, 404))
+        assert client._is_retryable_error(status_error(anthropic.RateLimitError, 429))
+        assert client._is_retryable_error(status_error(anthropic.InternalServerError, 529))
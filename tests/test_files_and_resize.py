@@ -12,6 +12,7 @@ import os
 from PIL import Image
 from ai_client.utils import read_text_files, resize_image_if_needed
 from ai_client import create_ai_client
+from ai_client import base_client
 
 
 class TestReadTextFiles:
@@ -78,6 +79,21 @@ class TestReadTextFiles:
 
         assert "File not found" in result or "Error" in result
 
+    def test_read_many_files_keeps_order(self, tmp_path):
+        """Test that concurrently read files keep their order and normalize newlines."""
+        paths = []
+        for i in range(6):
+            file_path = tmp_path / f"doc{i}.txt"
+            file_path.write_bytes(f"line {i}\r\nend {i}".encode("utf-8"))
+            paths.append(str(file_path))
+
+        result = read_text_files(paths)
+
+        positions = [result.index(f'<file name="doc{i}.txt">') for i in range(6)]
+        assert positions == sorted(positions)
+        assert "line 3\nend 3" in result
+        assert "\r" not in result
+
 
 class TestResizeImageIfNeeded:
     """Tests for image resizing functionality."""
@@ -388,3 +404,18 @@ class TestClientWithImageResize:
 
         # Verify the API was called (no resize occurred, but still works)
         assert client.api_client.chat.completions.create.called
+
+    def test_resize_result_is_cached(self, mocker, tmp_path):
+        """Test that repeated prompts with the same image reuse the resized file."""
+        img_path = tmp_path / "large.jpg"
+        Image.new("RGB", (4000, 3000), color="blue").save(str(img_path), "JPEG")
+
+        client = create_ai_client("openai", api_key="test-key", max_image_size=1024)
+        resize_spy = mocker.spy(base_client, "resize_image_if_needed")
+
+        first = client._resize_image(str(img_path))
+        second = client._resize_image(str(img_path))
+
+        assert first == second
+        assert first != str(img_path)
+        assert resize_spy.call_count == 1
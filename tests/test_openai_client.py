@@ -2,6 +2,7 @@
 Tests for OpenAI client implementation.
 """
 
+import base64
 import json
 from unittest.mock import Mock, patch
 from ai_client import create_ai_client, OpenAIClient
@@ -76,6 +77,87 @@ class TestOpenAIClient:
             assert isinstance(user_message["content"], list)
             assert any(item["type"] == "image_url" for item in user_message["content"])
 
+    def test_prompt_with_multiple_images_preserves_order(self, mock_openai_response, tmp_path):
+        """Test that concurrently encoded images keep their original order."""
+        png_path = tmp_path / "first.png"
+        jpg_path = tmp_path / "second.jpg"
+        png_path.write_bytes(b"png-bytes")
+        jpg_path.write_bytes(b"jpg-bytes")
+        url = "https://example.com/third.png"
+
+        with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
+            mock_client = Mock()
+            mock_openai_class.return_value = mock_client
+            mock_client.chat.completions.create.return_value = mock_openai_response
+
+            client = create_ai_client("openai", api_key="test-key", max_image_size=None)
+            client.prompt(
+                "gpt-4o",
+                "Compare these images",
+                images=[str(png_path), str(tmp_path / "missing.png"), url, str(jpg_path)],
+            )
+
+            content = mock_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+            urls = [item["image_url"]["url"] for item in content if item["type"] == "image_url"]
+            assert len(urls) == 3
+            assert urls[0].startswith("data:image/png;base64,")
+            assert urls[1] == url
+            assert urls[2].startswith("data:image/jpeg;base64,")
+
+    def test_image_data_uri_is_cached(self, tmp_path, mocker):
+        """Test that unchanged images are encoded once and changed images re-encoded."""
+        from ai_client import openai_client
+
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG first")
+        encode = mocker.spy(openai_client, "b64encode_file")
+
+        with patch("ai_client.openai_client.OpenAI"):
+            client = create_ai_client("openai", api_key="test-key")
+            first = client._encode_image_data_uri(str(image_path))
+            assert client._encode_image_data_uri(str(image_path)) == first
+            assert encode.call_count == 1
+            assert first.startswith("data:image/png;base64,")
+
+            image_path.write_bytes(b"\x89PNG second, longer")
+            assert client._encode_image_data_uri(str(image_path)) != first
+            assert encode.call_count == 2
+
+    def test_image_data_uri_mime_type_from_content(self, tmp_path):
+        """Test that the data URI MIME type follows the file content, then its extension."""
+        png_named_jpg = tmp_path / "image.jpg"
+        png_named_jpg.write_bytes(b"\x89PNG\r\n\x1a\n")
+        unknown_webp = tmp_path / "image.webp"
+        unknown_webp.write_bytes(b"not an image header")
+
+        with patch("ai_client.openai_client.OpenAI"):
+            client = create_ai_client("openai", api_key="test-key")
+
+            assert client._encode_image_data_uri(str(png_named_jpg)).startswith(
+                "data:image/png;base64,"
+            )
+            assert client._encode_image_data_uri(str(unknown_webp)).startswith(
+                "data:image/webp;base64,"
+            )
+
+    def test_image_data_uri_opens_file_once(self, tmp_path):
+        """Test that sniffing the MIME type and encoding share one file handle."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(100))
+
+        with (
+            patch("ai_client.openai_client.OpenAI"),
+            patch("builtins.open", wraps=open) as open_spy,
+        ):
+            client = create_ai_client("openai", api_key="test-key")
+            open_spy.reset_mock()
+            data_uri = client._encode_image_data_uri(str(image_path))
+
+        assert open_spy.call_count == 1
+        assert data_uri == "data:image/png;base64," + base64.b64encode(
+            image_path.read_bytes()
+        ).decode("ascii")
+
     def test_prompt_with_custom_temperature(self, mock_openai_response):
         """Test prompt with custom temperature."""
         with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
@@ -130,6 +212,62 @@ class TestOpenAIClient:
             assert response.parsed["name"] == "test"
             assert response.parsed["value"] == 42
 
+    def test_parsed_output_matches_text(self):
+        """Test that parsed data holds the same JSON-compatible values as the text."""
+        from datetime import date
+
+        from pydantic import BaseModel
+
+        class Event(BaseModel):
+            name: str
+            day: date
+            tags: list[str]
+
+        with patch("ai_client.openai_client.OpenAI"):
+            client = create_ai_client("openai", api_key="test-key")
+
+        raw_response = Mock()
+        raw_response.model = "gpt-4"
+        raw_response.usage = None
+        raw_response.choices = [Mock()]
+        raw_response.choices[0].finish_reason = "stop"
+        raw_response.choices[0].message.parsed = Event(
+            name="Fête", day=date(2024, 7, 14), tags=["fr"]
+        )
+
+        response = client._create_response_from_parsed(raw_response, "gpt-4")
+
+        assert response.parsed == {"name": "Fête", "day": "2024-07-14", "tags": ["fr"]}
+        assert json.loads(response.text) == response.parsed
+
+    def test_json_mode_fallback_reuses_schema_prompt(
+        self, mock_openai_response, mock_pydantic_model
+    ):
+        """Test that the JSON-mode schema instruction is built once per response model."""
+        with (
+            patch("ai_client.openai_client.OpenAI") as mock_openai_class,
+            patch.object(
+                mock_pydantic_model,
+                "model_json_schema",
+                wraps=mock_pydantic_model.model_json_schema,
+            ) as schema_spy,
+        ):
+            mock_client = Mock()
+            mock_openai_class.return_value = mock_client
+            mock_client.beta.chat.completions.parse.side_effect = Exception("parse failed")
+            mock_client.chat.completions.create.return_value = mock_openai_response
+
+            client = create_ai_client("openai", api_key="test-key")
+            for _ in range(2):
+                client.prompt("gpt-4", "Extract data", response_format=mock_pydantic_model)
+
+            assert schema_spy.call_count == 1
+            for call in mock_client.chat.completions.create.call_args_list:
+                assert call.kwargs["response_format"] == {"type": "json_object"}
+                user_content = call.kwargs["messages"][-1]["content"]
+                assert user_content[0]["text"] == "Extract data"
+                assert '"value"' in user_content[-1]["text"]
+
     def test_error_response_on_exception(self):
         """Test that errors are handled gracefully."""
         with patch("ai_client.openai_client.OpenAI") as mock_openai_class:
@@ -171,3 +309,31 @@ class TestOpenAIClient:
             assert models[1][0] == "gpt-3.5-turbo"
             # Check that dates are formatted
             assert isinstance(models[0][1], str)
+
+    def test_non_transient_errors_are_not_retried(self):
+        """Test that a 401 fails after one attempt while server errors are retried."""
+        import httpx
+        import openai
+
+        def status_error(cls, status_code):
+            request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            response = httpx.Response(status_code, request=request)
+            return cls("error", response=response, body=None)
+
+        with patch("ai_client.openai_client.OpenAI") as mock_openai:
+            create = mock_openai.return_value.chat.completions.create
+            create.side_effect = status_error(openai.AuthenticationError, 401)
+
+            client = create_ai_client("openai", api_key="test-key")
+            response = client.prompt("gpt-4", "Hello")
+
+            assert response.finish_reason == "error"
+            assert create.call_count == 1
+
+        assert not client._is_retryable_error(status_error(openai.NotFoundError, 404))
+        assert not client._is_retryable_error(status_error(openai.BadRequestError, 400))
+        assert client._is_retryable_error(status_error(openai.RateLimitError, 429))
+        assert client._is_retryable_error(status_error(openai.InternalServerError, 503))
+        assert client._is_retryable_error(
+            openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+        )
@@ -0,0 +1,62 @@
+"""
+Tests for pricing lookups and cost calculation.
+"""
+
+import json
+
+from ai_client.pricing import PricingManager
+
+
+def _write_pricing(tmp_path):
+    """Write a small pricing file with two dated tables."""
+    pricing_file = tmp_path / "pricing.json"
+    pricing_file.write_text(
+        json.dumps(
+            {
+                "pricing": {
+                    "2024-01-01": {
+                        "anthropic": {"claude-test": {"input_price": 1.0, "output_price": 2.0}}
+                    },
+                    "2025-01-01": {
+                        "anthropic": {"claude-test": {"input_price": 3.0, "output_price": 6.0}}
+                    },
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    return str(pricing_file)
+
+
+class TestPricingManager:
+    """Tests for PricingManager."""
+
+    def test_most_recent_price_wins(self, tmp_path):
+        """Test that the newest dated table takes precedence."""
+        manager = PricingManager(_write_pricing(tmp_path))
+
+        assert manager.get_model_pricing("anthropic", "claude-test") == (3.0, 6.0)
+        assert manager.priced_models("anthropic") == {"claude-test"}
+
+    def test_date_suffix_fallback(self, tmp_path):
+        """Test that dated model names fall back to the base model price."""
+        manager = PricingManager(_write_pricing(tmp_path))
+
+        assert manager.get_model_pricing("anthropic", "claude-test-20250101") == (3.0, 6.0)
+        assert manager.get_model_pricing("anthropic", "claude-test-2025-01-01") == (3.0, 6.0)
+
+    def test_lookups_are_cached(self, tmp_path, mocker):
+        """Test that repeated lookups, including misses, are served from the cache."""
+        manager = PricingManager(_write_pricing(tmp_path))
+        lookup = mocker.spy(manager, "_lookup_model_pricing")
+
+        for _ in range(3):
+            assert manager.get_model_pricing("anthropic", "unknown-model") is None
+            manager.calculate_cost("anthropic", "claude-test", 1_000_000, 1_000_000)
+
+        assert lookup.call_count == 2
+        assert manager.calculate_cost("anthropic", "claude-test", 1_000_000, 500_000) == (
+            3.0,
+            3.0,
+            6.0,
+        )
@@ -2,7 +2,11 @@
 Tests for response dataclasses (LLMResponse, Usage).
 """
 
+import json
 from datetime import datetime
+
+import pytest
+
 from ai_client.response import Usage, LLMResponse
 
 
@@ -132,6 +136,25 @@ class TestLLMResponse:
         # timestamp should be ISO format string
         assert isinstance(result["timestamp"], str)
 
+    def test_llm_response_to_json(self):
+        """Test that LLMResponse.to_json() serializes the to_dict() fields."""
+        response = LLMResponse(
+            text="Grüezi",
+            model="gpt-4",
+            provider="openai",
+            finish_reason="stop",
+            usage=Usage(input_tokens=10, output_tokens=20, total_tokens=30),
+            raw_response=object(),
+            timestamp=datetime(2025, 1, 1, 12, 0, 0),
+            parsed={"greeting": "Grüezi"},
+        )
+
+        result = response.to_json()
+
+        assert json.loads(result) == response.to_dict()
+        assert '"text":"Grüezi"' in result
+        assert '"timestamp":"2025-01-01T12:00:00"' in result
+
     def test_llm_response_custom_timestamp(self):
         """Test LLMResponse with custom timestamp."""
         usage = Usage(input_tokens=10, output_tokens=20, total_tokens=30)
@@ -148,3 +171,20 @@ class TestLLMResponse:
         )
 
         assert response.timestamp == custom_time
+
+    def test_llm_response_uses_slots(self):
+        """Test that response objects are slotted and reject unknown attributes."""
+        usage = Usage(input_tokens=10, output_tokens=20, total_tokens=30)
+        response = LLMResponse(
+            text="Hello",
+            model="gpt-4",
+            provider="openai",
+            finish_reason="stop",
+            usage=usage,
+            raw_response={},
+        )
+
+        assert not hasattr(usage, "__dict__")
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.unknown_field = "value"
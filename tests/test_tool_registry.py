@@ -0,0 +1,132 @@
+"""
+Tests for the tool registry.
+"""
+
+import json
+
+import pytest
+
+from ai_client.tools import ToolRegistry
+from ai_client.utils import ToolRegistryError
+
+
+def _write_registry(tmp_path, tools):
+    """Write a registry file with the given tool definitions."""
+    registry_file = tmp_path / "tools.json"
+    registry_file.write_text(json.dumps({"version": "1.0", "tools": tools}), encoding="utf-8")
+    return registry_file
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry_cache():
+    """Start every test without parsed registry files."""
+    ToolRegistry.clear_cache()
+    yield
+    ToolRegistry.clear_cache()
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    def test_default_registry(self):
+        """Test that the bundled registry provides the built-in tools."""
+        registry = ToolRegistry()
+
+        assert "GeonamesSearch" in registry.list_tools()
+        assert registry.get_tool("GeonamesSearch")["function"] == "search_geonames"
+
+    def test_default_registry_read_as_package_resource(self, mocker):
+        """Test that the bundled registry is loaded from package data, not via a file stat."""
+        from ai_client.tools import registry as registry_module
+
+        file_loader = mocker.spy(registry_module, "_load_registry_cached")
+
+        registry = ToolRegistry()
+
+        assert file_loader.call_count == 0
+        assert registry.tools is registry_module._load_default_registry()
+
+    def test_custom_registry(self, tmp_path):
+        """Test loading a registry file with non-ASCII content."""
+        registry_file = _write_registry(
+            tmp_path, {"Lookup": {"executor": "python_function", "description": "Zürich"}}
+        )
+
+        registry = ToolRegistry(str(registry_file))
+
+        assert list(registry.list_tools()) == ["Lookup"]
+        assert registry.get_tool("Lookup")["description"] == "Zürich"
+
+    def test_tool_definitions_are_read_only(self, tmp_path):
+        """Test that get_tool returns a shared definition that cannot be modified."""
+        registry = ToolRegistry(str(_write_registry(tmp_path, {"Lookup": {"description": "a"}})))
+        definition = registry.get_tool("Lookup")
+
+        with pytest.raises(TypeError):
+            definition["description"] = "b"
+
+        copy = definition.copy()
+        copy["description"] = "b"
+        assert registry.get_tool("Lookup")["description"] == "a"
+
+    def test_unknown_tool(self, tmp_path):
+        """Test that unknown tool names raise ToolRegistryError listing the known ones."""
+        registry = ToolRegistry(str(_write_registry(tmp_path, {"Lookup": {}})))
+
+        with pytest.raises(ToolRegistryError, match="Available tools: Lookup"):
+            registry.get_tool("Missing")
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing registry file raises ToolRegistryError."""
+        with pytest.raises(ToolRegistryError, match="not found"):
+            ToolRegistry(str(tmp_path / "missing.json"))
+
+    def test_invalid_json(self, tmp_path):
+        """Test that a malformed registry file raises ToolRegistryError."""
+        registry_file = tmp_path / "tools.json"
+        registry_file.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(ToolRegistryError, match="Invalid JSON"):
+            ToolRegistry(str(registry_file))
+
+    def test_parsed_file_is_shared(self, tmp_path, mocker):
+        """Test that an unchanged file is parsed once into a read-only mapping."""
+        from ai_client.tools import registry as registry_module
+
+        registry_file = _write_registry(tmp_path, {"Lookup": {}})
+        parse = mocker.spy(registry_module, "json_loads")
+
+        first = ToolRegistry(str(registry_file))
+        with ToolRegistry._instances_lock:
+            ToolRegistry._instances.clear()
+        second = ToolRegistry(str(registry_file))
+
+        assert first is not second
+        assert parse.call_count == 1
+        assert first.tools is second.tools
+        with pytest.raises(TypeError):
+            first.tools["Other"] = {}
+
+    def test_registry_shared_per_path(self, tmp_path, monkeypatch):
+        """Test that registries for the same file are one instance until the cache is cleared."""
+        registry_file = _write_registry(tmp_path, {"Lookup": {}})
+        first = ToolRegistry(str(registry_file))
+
+        monkeypatch.chdir(tmp_path)
+        assert ToolRegistry("tools.json") is first
+
+        _write_registry(tmp_path, {"Lookup": {}, "Search": {}})
+        assert list(ToolRegistry(str(registry_file)).list_tools()) == ["Lookup"]
+
+        ToolRegistry.clear_cache()
+        assert list(ToolRegistry(str(registry_file)).list_tools()) == ["Lookup", "Search"]
+
+    def test_failed_load_is_not_shared(self, tmp_path):
+        """Test that a registry file that failed to load is read again next time."""
+        registry_file = tmp_path / "tools.json"
+
+        with pytest.raises(ToolRegistryError):
+            ToolRegistry(str(registry_file))
+
+        _write_registry(tmp_path, {"Lookup": {}})
+        assert list(ToolRegistry(str(registry_file)).list_tools()) == ["Lookup"]
@@ -2,12 +2,20 @@
 Tests for utility functions.
 """
 
+import base64
 import pytest
 import time
 from ai_client.utils import (
+    async_retry_with_exponential_backoff,
+    b64encode_bytes,
+    b64encode_file,
+    extract_json_from_text,
     retry_with_exponential_backoff,
     is_rate_limit_error,
     get_retry_delay_from_error,
+    json_dumps,
+    json_loads,
+    sniff_image_mime_type,
     RateLimitError,
     APIError,
 )
@@ -118,6 +126,112 @@ class TestRetryWithExponentialBackoff:
 
         assert len(call_count) == 2
 
+    def test_retry_if_predicate_stops_retries(self):
+        """Test that retry_if can reject an otherwise retryable exception."""
+        call_count = []
+
+        def failing_func():
+            call_count.append(1)
+            raise ValueError("permanent")
+
+        wrapped = retry_with_exponential_backoff(
+            failing_func,
+            max_retries=3,
+            initial_delay=0.01,
+            retry_if=lambda e: "permanent" not in str(e),
+        )
+
+        with pytest.raises(ValueError, match="permanent"):
+            wrapped()
+
+        assert len(call_count) == 1
+
+    def test_max_total_wait_stops_retries(self):
+        """Test that a retry whose delay would exceed the budget is not attempted."""
+        call_count = []
+
+        def failing_func():
+            call_count.append(1)
+            raise ValueError("Retry me")
+
+        wrapped = retry_with_exponential_backoff(
+            failing_func, max_retries=5, initial_delay=0.05, max_total_wait=0.1
+        )
+
+        with pytest.raises(ValueError, match="Retry me"):
+            wrapped()
+
+        # Delays 0.05s and 0.1s: only the first one fits in the budget
+        assert len(call_count) == 2
+
+    def test_server_delay_hint_and_jitter(self, mocker):
+        """Test that a delay from the error message is used, with at most 10% jitter."""
+        sleep = mocker.patch("ai_client.utils.time.sleep")
+        call_count = []
+
+        def failing_func():
+            call_count.append(1)
+            if len(call_count) == 1:
+                raise ValueError("Rate limited, retry after 7 seconds")
+            if len(call_count) == 2:
+                raise ValueError("Temporary error")
+            return "done"
+
+        wrapped = retry_with_exponential_backoff(failing_func, max_retries=3, initial_delay=1.0)
+
+        assert wrapped() == "done"
+        server_wait, backoff_wait = (c.args[0] for c in sleep.call_args_list)
+        assert 7.0 <= server_wait <= 7.7
+        assert 2.0 <= backoff_wait <= 2.2
+
+    def test_server_delay_hint_capped_at_max_delay(self, mocker):
+        """Test that a delay hint larger than max_delay waits at most max_delay."""
+        sleep = mocker.patch("ai_client.utils.time.sleep")
+        call_count = []
+
+        def failing_func():
+            call_count.append(1)
+            if len(call_count) == 1:
+                raise ValueError("Rate limited, retry after 3600 seconds")
+            return "done"
+
+        wrapped = retry_with_exponential_backoff(failing_func, max_retries=3, max_delay=5.0)
+
+        assert wrapped() == "done"
+        assert sleep.call_args.args[0] == 5.0
+
+    def test_jitter_never_exceeds_max_delay(self, mocker):
+        """Test that jitter added to a delay already at max_delay is capped too."""
+        sleep = mocker.patch("ai_client.utils.time.sleep")
+        mocker.patch("ai_client.utils.random.random", return_value=0.99)
+
+        def failing_func():
+            raise ValueError("Retry me")
+
+        wrapped = retry_with_exponential_backoff(
+            failing_func, max_retries=2, initial_delay=5.0, max_delay=5.0
+        )
+
+        with pytest.raises(ValueError, match="Retry me"):
+            wrapped()
+
+        assert [c.args[0] for c in sleep.call_args_list] == [5.0, 5.0]
+
+    async def test_async_jitter_never_exceeds_max_delay(self, mocker):
+        """Test that the async helper caps jittered delays at max_delay as well."""
+        sleep = mocker.patch("ai_client.utils.asyncio.sleep", new_callable=mocker.AsyncMock)
+        mocker.patch("ai_client.utils.random.random", return_value=0.99)
+
+        async def failing_func():
+            raise ValueError("Rate limited, retry after 3600 seconds")
+
+        wrapped = async_retry_with_exponential_backoff(failing_func, max_retries=1, max_delay=5.0)
+
+        with pytest.raises(ValueError, match="Rate limited"):
+            await wrapped()
+
+        sleep.assert_awaited_once_with(5.0)
+
 
 class TestIsRateLimitError:
     """Tests for is_rate_limit_error function."""
@@ -150,6 +264,12 @@ class TestIsRateLimitError:
             error = Exception(msg)
             assert is_rate_limit_error(error) is False
 
+    def test_detects_rate_limit_in_raw_body(self):
+        """Test that bytes error bodies are checked without decoding."""
+        assert is_rate_limit_error(Exception(b'{"error": "RESOURCE_EXHAUSTED"}')) is True
+        assert is_rate_limit_error(Exception(bytearray(b"HTTP 429"))) is True
+        assert is_rate_limit_error(Exception(b"\xff invalid utf-8 \xfe")) is False
+
 
 class TestGetRetryDelayFromError:
     """Tests for get_retry_delay_from_error function."""
@@ -174,6 +294,137 @@ class TestGetRetryDelayFromError:
         assert delay is None
 
 
+class TestB64EncodeFile:
+    """Tests for b64encode_file function."""
+
+    def test_matches_stdlib_encoding(self, tmp_path):
+        """Test chunked encoding matches encoding the whole file at once."""
+        for size in (0, 1, 2, 3, 10, 11, 12, 100):
+            data = bytes(range(256)) * (size // 256 + 1)
+            data = data[:size]
+            path = tmp_path / f"data_{size}.bin"
+            path.write_bytes(data)
+
+            encoded = b64encode_file(str(path), chunk_size=3)
+            assert encoded == base64.b64encode(data).decode("ascii")
+
+    def test_prefix_is_written_before_data(self, tmp_path):
+        """Test that a data URI prefix is placed in front of the encoded file."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"\x89PNG\r\n")
+
+        encoded = b64encode_file(str(path), prefix="data:image/png;base64,")
+        assert encoded == "data:image/png;base64," + base64.b64encode(b"\x89PNG\r\n").decode()
+
+    def test_encodes_open_file_from_current_position(self, tmp_path):
+        """Test that an open file object is encoded from its current position to the end."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"skip" + bytes(range(100)))
+
+        with open(path, "rb") as f:
+            f.seek(4)
+            encoded = b64encode_file(f, chunk_size=9)
+
+        assert encoded == base64.b64encode(bytes(range(100))).decode("ascii")
+
+    def test_encode_bytes_without_pybase64(self, monkeypatch):
+        """Test that b64encode_bytes matches the stdlib with and without pybase64."""
+        from ai_client import utils
+
+        data = bytes(range(256)) * 3
+        expected = base64.b64encode(data).decode("ascii")
+
+        assert b64encode_bytes(data) == expected
+        monkeypatch.setattr(utils, "pybase64", None)
+        assert b64encode_bytes(data) == expected
+
+    def test_rejects_invalid_chunk_size(self, tmp_path):
+        """Test that chunk sizes which would insert padding are rejected."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abc")
+
+        with pytest.raises(ValueError):
+            b64encode_file(str(path), chunk_size=4)
+
+
+class TestSniffImageMimeType:
+    """Tests for sniff_image_mime_type function."""
+
+    @pytest.mark.parametrize(
+        "head,expected",
+        [
+            (b"\x89PNG\r\n\x1a\n\x00\x00\x00\r", "image/png"),
+            (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01", "image/jpeg"),
+            (b"GIF89a\x01\x00\x01\x00\x80\x00", "image/gif"),
+            (b"RIFF\x24\x00\x00\x00WEBP", "image/webp"),
+            (b"RIFF\x24\x00\x00\x00WAVE", None),
+            (b"", None),
+        ],
+    )
+    def test_magic_bytes(self, head, expected):
+        """Test detection of common image formats from their leading bytes."""
+        assert sniff_image_mime_type(head) == expected
+
+
+class TestExtractJsonFromText:
+    """Tests for extract_json_from_text function."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ('{"a": 1}', {"a": 1}),
+            ('Here you go:\n```json\n{"a": 1}\n```', {"a": 1}),
+            ("```\n[1, 2]\n```", [1, 2]),
+            ('```python\nx = 1\n```\nand\n```json\n{"a": 2}\n```', {"a": 2}),
+            ("```\nnot json\n```", None),
+            ('"just a string"', None),
+            ("", None),
+        ],
+    )
+    def test_extract(self, text, expected):
+        """Test plain JSON, fenced JSON and rejected inputs."""
+        assert extract_json_from_text(text) == expected
+
+
+class TestJsonDumps:
+    """Tests for json_dumps function."""
+
+    def test_output_matches_without_orjson(self, monkeypatch):
+        """Test that the orjson and stdlib paths produce the same compact output."""
+        from ai_client import utils
+
+        data = {"name": "Zürich", "values": [1, 2.5, None, True]}
+        expected = '{"name":"Zürich","values":[1,2.5,null,true]}'
+
+        assert json_dumps(data) == expected
+        monkeypatch.setattr(utils, "orjson", None)
+        assert json_dumps(data) == expected
+
+    def test_falls_back_for_unsupported_input(self):
+        """Test that objects orjson rejects are serialized by the stdlib."""
+        assert json_dumps({1: "a"}) == '{"1":"a"}'
+
+
+class TestJsonLoads:
+    """Tests for json_loads function."""
+
+    def test_parses_bytes_and_str_without_orjson(self, monkeypatch):
+        """Test that the orjson and stdlib paths parse bytes and strings alike."""
+        import json
+
+        from ai_client import utils
+
+        document = '{"name": "Zürich", "values": [1, 2.5, null]}'
+        expected = {"name": "Zürich", "values": [1, 2.5, None]}
+
+        for orjson_module in (utils.orjson, None):
+            monkeypatch.setattr(utils, "orjson", orjson_module)
+            assert json_loads(document) == expected
+            assert json_loads(document.encode("utf-8")) == expected
+            with pytest.raises(json.JSONDecodeError):
+                json_loads(b"{not json")
+
+
 class TestExceptions:
     """Tests for custom exceptions."""
 